@@ -1,14 +1,76 @@
-"""Base agent class for Claims Coverage Reasoner agents (AWS Bedrock)."""
+"""Base agent class for Claims Coverage Reasoner agents (AWS Bedrock).
 
+Agent plugin names are held as a tuple; get_plugin_names returns it directly.
+"""
+
+import asyncio
+import contextvars
+import hashlib
 import logging
-from typing import Dict, Any, List, Optional
+import threading
+import weakref
+from typing import Dict, Any, List, Optional, Tuple
 from abc import ABC, abstractmethod
 
-from ..utils.bedrock_client import BedrockClient
+import numpy as np
+
+from ..utils.bedrock_client import BedrockClient, get_default_bedrock_client
 from ..utils.config import Config
+from ..utils.semantic_cache import SemanticCache
 
 logger = logging.getLogger(__name__)
 
+# Converse prompt-caching marker; everything before it is eligible for reuse.
+CACHE_POINT: Dict[str, Any] = {"cachePoint": {"type": "default"}}
+
+# Titan v2 accepts ~8k tokens; longer prompts are embedded by their head.
+SEMANTIC_CACHE_MAX_CHARS = 20000
+
+# Managed Bedrock Agents keep conversation state server-side per session; the
+# supervisor scopes it to the case being processed. A context variable keeps
+# concurrent runs (one event loop per reasoner thread) from seeing each other's.
+_agent_session_id: contextvars.ContextVar[Optional[str]] = contextvars.ContextVar(
+    "agent_session_id", default=None
+)
+
+_semantic_cache: Optional[SemanticCache] = None
+_semantic_cache_lock = threading.Lock()
+
+
+def set_agent_session(session_id: Optional[str]) -> None:
+    """
+    Set the managed-agent session ID for agent calls in the current context.
+
+    Args:
+        session_id: Session identifier (the claim case ID), or None to reset
+    """
+    _agent_session_id.set(session_id)
+
+
+def get_semantic_cache(config: Config) -> Optional[SemanticCache]:
+    """
+    Return the process-wide semantic response cache, creating it on first use.
+
+    Args:
+        config: Loaded application configuration
+
+    Returns:
+        Shared SemanticCache, or None when the cache is disabled
+    """
+    global _semantic_cache
+    if not config.semantic_cache.enabled:
+        return None
+    with _semantic_cache_lock:
+        if _semantic_cache is None:
+            _semantic_cache = SemanticCache(
+                dimension=config.vector_store.dimension,
+                threshold=config.semantic_cache.threshold,
+                ttl_seconds=config.semantic_cache.ttl_seconds,
+                max_entries=config.semantic_cache.max_entries,
+                max_namespaces=config.semantic_cache.max_namespaces,
+            )
+    return _semantic_cache
+
 
 class BaseClaimsAgent(ABC):
     """
@@ -17,10 +79,32 @@ class BaseClaimsAgent(ABC):
     Attributes:
         name: Agent name/identifier
         instructions: System instructions for the agent
-        plugins: List of plugin names (for bookkeeping)
+        plugins: Tuple of plugin names (for bookkeeping)
         bedrock: BedrockClient for LLM calls
     """
 
+    __slots__ = (
+        "name",
+        "instructions",
+        "plugins",
+        "bedrock",
+        "_system_prompts",
+        "_cached_system_prompts",
+        "_system_digest",
+        "_managed_agent_ids",
+        "_prompt_caching",
+        "_max_concurrency",
+        "_max_history_messages",
+        "_prefix_digests",
+        "_semantic_cache",
+    )
+
+    # Shared by every agent: one semaphore per (event loop, model). Each
+    # reasoner run gets its own loop, and asyncio primitives cannot cross loops.
+    _bedrock_semaphores: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, asyncio.Semaphore]]" = (
+        weakref.WeakKeyDictionary()
+    )
+
     def __init__(
         self,
         name: str,
@@ -30,31 +114,69 @@ class BaseClaimsAgent(ABC):
     ):
         self.name = name
         self.instructions = instructions
-        self.plugins = plugins or []
+        # System blocks are fixed per agent: build them (and their digest) once
+        # and send the same lists on every call; boto3 never mutates its params.
+        self._system_prompts: List[Dict[str, Any]] = [{"text": instructions}]
+        self._cached_system_prompts: List[Dict[str, Any]] = [{"text": instructions}, CACHE_POINT]
+        self._system_digest = hashlib.blake2b(
+            repr(self._system_prompts).encode("utf-8"), digest_size=8
+        ).hexdigest()
+        self.plugins: Tuple[str, ...] = tuple(plugins or ())
 
+        config = Config.load()
         if bedrock is not None:
             self.bedrock = bedrock
         else:
-            config = Config.load()
-            self.bedrock = BedrockClient(
+            self.bedrock = get_default_bedrock_client(
                 region=config.aws_region,
                 model_id=config.bedrock.model_id,
                 embedding_model_id=config.bedrock.embedding_model_id,
                 timeout=config.bedrock.timeout,
                 max_retries=config.bedrock.max_retries,
             )
-        # Cache Bedrock Agents (managed) config
-        self._agents_cfg = Config.load().bedrock_agents
-
-        logger.info(
-            f"Initialized {self.__class__.__name__}: {name} with {len(self.plugins)} plugins"
+        # Resolve this role's managed Bedrock Agent (if any) once, not per call
+        agents_cfg = config.bedrock_agents
+        role_to_ids = {
+            "evidence-curator": (agents_cfg.curator_agent_id, agents_cfg.curator_alias_id),
+            "policy-interpreter": (agents_cfg.interpreter_agent_id, agents_cfg.interpreter_alias_id),
+            "compliance-reviewer": (agents_cfg.reviewer_agent_id, agents_cfg.reviewer_alias_id),
+        }
+        agent_id, alias_id = role_to_ids.get(name, ("", ""))
+        self._managed_agent_ids: Optional[Tuple[str, str]] = (
+            (agent_id, alias_id) if agents_cfg.enabled and agent_id and alias_id else None
         )
+        self._prompt_caching = config.bedrock.prompt_caching
+        self._max_concurrency = max(1, config.bedrock.max_concurrency)
+        self._max_history_messages = max(0, config.bedrock.max_history_messages)
+        # Digests of the prompt prefix sent last time, for cache-break logging
+        self._prefix_digests: List[str] = []
+        self._semantic_cache = get_semantic_cache(config)
+
+        logger.info("Initialized %s: %s with %d plugins", type(self).__name__, name, len(self.plugins))
 
     @abstractmethod
     async def invoke(self, context: Dict[str, Any]) -> Dict[str, Any]:
         """Process agent turn with access to tools/plugins."""
         pass
 
+    async def invoke_batch(self, contexts: List[Dict[str, Any]]) -> List[Any]:
+        """
+        Invoke the agent for several independent contexts (e.g. claims) concurrently.
+
+        In-flight Bedrock calls stay capped by the per-model semaphore in
+        get_response (bedrock.max_concurrency), so no extra limit is applied here.
+
+        Args:
+            contexts: One invoke() context per claim
+
+        Returns:
+            Results in context order; a failed invocation yields its exception
+        """
+        return await asyncio.gather(
+            *(self.invoke(context) for context in contexts),
+            return_exceptions=True
+        )
+
     async def get_response(
         self,
         conversation_history: Optional[List[Dict[str, Any]]],
@@ -69,55 +191,207 @@ class BaseClaimsAgent(ABC):
         """
         try:
             # If using managed Agents for Bedrock and configured for this role, invoke it
-            if getattr(self._agents_cfg, "enabled", False):
-                role_to_ids = {
-                    "evidence-curator": (self._agents_cfg.curator_agent_id, self._agents_cfg.curator_alias_id),
-                    "policy-interpreter": (self._agents_cfg.interpreter_agent_id, self._agents_cfg.interpreter_alias_id),
-                    "compliance-reviewer": (self._agents_cfg.reviewer_agent_id, self._agents_cfg.reviewer_alias_id),
-                }
-                agent_id, alias_id = role_to_ids.get(self.name, ("", ""))
-                if agent_id and alias_id:
-                    # Note: Agents maintain session state; we send current user prompt.
+            if self._managed_agent_ids is not None:
+                agent_id, alias_id = self._managed_agent_ids
+                # Agents keep the conversation in their case-scoped session, so
+                # only the new prompt is sent, never the full history.
+                async with self._bedrock_slot("bedrock-agents"):
                     response_text = await self.bedrock.invoke_managed_agent(
                         agent_id=agent_id,
                         agent_alias_id=alias_id,
                         input_text=user_message,
-                        session_id=None,
+                        session_id=_agent_session_id.get(),
                     )
-                    logger.debug(f"{self.name} (managed agent) response: {response_text[:100]}...")
-                    return response_text
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("%s (managed agent) response: %s...", self.name, response_text[:100])
+                return response_text
 
             # Default: direct model invocation via Converse API
-            messages: List[Dict[str, Any]] = []
-            if conversation_history:
-                messages.extend(conversation_history)
-            messages.append({"role": "user", "content": [{"text": user_message}]})
-
-            system_prompts = [{"text": self.instructions}]
-            result = await self.bedrock.invoke_nova_pro(
-                messages=messages,
-                system_prompts=system_prompts,
-                temperature=temperature,
-                max_tokens=max_tokens,
-            )
+            history = self._recent_history(conversation_history)
+
+            # Semantic cache: only deterministic calls are safe to replay.
+            cache_namespace: Optional[str] = None
+            query_embedding: Optional[np.ndarray] = None
+            if self._semantic_cache is not None and temperature <= 0:
+                cache_namespace = self._semantic_cache_namespace(history, max_tokens)
+                # Verbatim repeats (e.g. re-running a case) need no embedding round trip.
+                cached = self._semantic_cache.lookup_exact(cache_namespace, user_message)
+                if cached is not None:
+                    logger.info("%s served response from semantic cache (exact)", self.name)
+                    return cached
+                query_embedding = await self._embed_for_cache(user_message)
+                if query_embedding is not None:
+                    cached = self._semantic_cache.lookup(cache_namespace, query_embedding)
+                    if cached is not None:
+                        logger.info("%s served response from semantic cache", self.name)
+                        return cached
+
+            messages, system_prompts = self._build_converse_request(history, user_message)
+            async with self._bedrock_slot(self.bedrock.model_id):
+                result = await self.bedrock.invoke_nova_pro(
+                    messages=messages,
+                    system_prompts=system_prompts,
+                    temperature=temperature,
+                    max_tokens=max_tokens,
+                )
 
             # Parse text content from Bedrock response shape
-            outputs = result.get("content", [])
-            text_parts: List[str] = []
-            for item in outputs:
-                if isinstance(item, dict) and item.get("text"):
-                    text_parts.append(item["text"])
-            response_text = "\n".join(text_parts) if text_parts else ""
-
-            logger.debug(f"{self.name} generated response: {response_text[:100]}...")
+            response_text = "\n".join(
+                item["text"]
+                for item in result.get("content", [])
+                if isinstance(item, dict) and item.get("text")
+            )
+
+            if query_embedding is not None and response_text:
+                self._semantic_cache.store(cache_namespace, query_embedding, response_text, user_message)
+
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("%s generated response: %s...", self.name, response_text[:100])
             return response_text
 
         except Exception as e:
-            logger.error(f"Error getting response from {self.name}: {str(e)}")
+            logger.error("Error getting response from %s: %s", self.name, e)
             raise
 
-    def get_plugin_names(self) -> List[str]:
-        return self.plugins.copy()
+    def _build_converse_request(
+        self,
+        history: List[Dict[str, Any]],
+        user_message: str,
+    ) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """
+        Assemble Converse messages and system blocks for one call.
+
+        Args:
+            history: Conversation history; left unmodified
+            user_message: Prompt to append as the final user turn
+
+        Returns:
+            Tuple of (messages, system_prompts), with cache points when enabled
+        """
+        messages: List[Dict[str, Any]] = list(history)
+        system_prompts = self._system_prompts
+
+        if self._prompt_caching:
+            # Digesting every history message is O(history) per call; only pay
+            # for it when the diagnostic will be emitted.
+            if logger.isEnabledFor(logging.DEBUG):
+                self._log_cache_break(messages)
+            system_prompts = self._cached_system_prompts
+            if messages:
+                # Mark the end of the shared history; copy so callers' lists stay untouched.
+                last = messages[-1]
+                messages[-1] = {**last, "content": [*last.get("content", []), CACHE_POINT]}
+
+        messages.append({"role": "user", "content": [{"text": user_message}]})
+        return messages, system_prompts
+
+    def _recent_history(self, history: Optional[List[Dict[str, Any]]]) -> List[Dict[str, Any]]:
+        """
+        Keep only the most recent history messages (bedrock.max_history_messages).
+
+        Without a cap every turn re-sends the whole dialog, so prompt tokens grow
+        quadratically over a long conversation. Converse requires the first
+        message to be a user turn, so a window that would open on an assistant
+        reply is shortened past it. Once the window starts sliding, each call's
+        prefix differs from the last, so prompt caching only helps below the cap.
+
+        Args:
+            history: Conversation history as passed by the caller; left unmodified
+
+        Returns:
+            The caller's list when within the cap, otherwise a trimmed copy
+        """
+        if not history:
+            return []
+        limit = self._max_history_messages
+        if not limit or len(history) <= limit:
+            return history
+
+        start = len(history) - limit
+        while start < len(history) and history[start].get("role") != "user":
+            start += 1
+        logger.debug("%s forwarding %d of %d history messages", self.name, len(history) - start, len(history))
+        return history[start:]
+
+    def _semantic_cache_namespace(self, history: List[Dict[str, Any]], max_tokens: int) -> str:
+        """
+        Digest everything besides the user message that shapes a response.
+
+        Prompts are only compared for similarity within one namespace, so a
+        cached answer never crosses agents, models, or conversation histories.
+
+        Args:
+            history: Conversation history about to be sent
+            max_tokens: Output token limit for the call
+
+        Returns:
+            Hex digest naming the cache partition
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(f"{self.bedrock.model_id}\0{max_tokens}\0{self.instructions}\0".encode("utf-8"))
+        digest.update(repr(history).encode("utf-8"))
+        return digest.hexdigest()
+
+    async def _embed_for_cache(self, user_message: str) -> Optional[np.ndarray]:
+        """
+        Embed a user message for semantic cache lookup.
+
+        Args:
+            user_message: Prompt about to be sent
+
+        Returns:
+            Embedding vector, or None if embedding failed (the call proceeds uncached)
+        """
+        try:
+            async with self._bedrock_slot(self.bedrock.embedding_model_id):
+                return await self.bedrock.generate_embedding(user_message[:SEMANTIC_CACHE_MAX_CHARS])
+        except Exception as e:
+            logger.warning("%s semantic cache lookup skipped: %s", self.name, e)
+            return None
+
+    def _bedrock_slot(self, model_key: str) -> asyncio.Semaphore:
+        """
+        Return the semaphore bounding concurrent Bedrock calls for a model.
+
+        Args:
+            model_key: Model ID (or managed-agents key) the call targets
+
+        Returns:
+            Semaphore bound to the running event loop
+        """
+        per_model = BaseClaimsAgent._bedrock_semaphores.setdefault(asyncio.get_running_loop(), {})
+        semaphore = per_model.get(model_key)
+        if semaphore is None:
+            semaphore = per_model[model_key] = asyncio.Semaphore(self._max_concurrency)
+        return semaphore
+
+    def _log_cache_break(self, history: List[Dict[str, Any]]) -> None:
+        """
+        Log when this call's prompt prefix no longer extends the previous one.
+
+        Provider-side prompt caches only hit on an exact prefix match, so a
+        rewritten history (e.g. a resumed round rebuilding its messages) quietly
+        forfeits the cache. Surfacing it keeps those busts visible at DEBUG.
+        Once the history window slides (bedrock.max_history_messages), every
+        call breaks the prefix, so this is a diagnostic rather than an alert.
+
+        Args:
+            history: Conversation history about to be sent, before the new user turn
+        """
+        digests = [self._system_digest]
+        for message in history:
+            digests.append(hashlib.blake2b(repr(message).encode("utf-8"), digest_size=8).hexdigest())
+
+        previous = self._prefix_digests
+        if previous:
+            if digests[0] != previous[0]:
+                logger.debug("%s prompt cache break: system prompt changed", self.name)
+            elif digests[:len(previous)] != previous:
+                logger.debug("%s prompt cache break: conversation history was rewritten", self.name)
+        self._prefix_digests = digests
+
+    def get_plugin_names(self) -> Tuple[str, ...]:
+        return self.plugins
 
     def __str__(self) -> str:
         return f"{self.__class__.__name__}(name={self.name})"
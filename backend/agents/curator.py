@@ -1,9 +1,14 @@
 """Evidence Curator agent for extracting and structuring claim evidence."""
 
+import asyncio
 import json
 import logging
+import re
 import time
-from typing import Any, Dict, List, Optional
+from contextlib import contextmanager
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Dict, Iterator, List, Optional
 
 from .base import BaseClaimsAgent
 from ..plugins.image_analyzer import ImageAnalyzerPlugin
@@ -11,11 +16,88 @@ from ..plugins.pdf_extractor import PDFExtractorPlugin
 from ..plugins.exif_reader import EXIFReaderPlugin
 from ..plugins.invoice_parser import InvoiceParserPlugin
 from ..utils.response_formatter import ResponseFormatter
-from ..utils.bedrock_client import BedrockClient
+from ..utils.bedrock_client import BedrockClient, get_default_bedrock_client
 from ..utils.config import Config
+from ..utils.content_cache import ContentCache
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
+_JSON_DECODER = json.JSONDecoder()
+
+# Shared read-only fallback for optional nested mappings; never mutated
+_EMPTY_MAPPING = MappingProxyType({})
+
+# Photos analyzed per multi-image Nova Pro request
+PHOTO_BATCH_SIZE = 4
+
+# Bedrock-backed plugin results keyed by file content, shared by all curators so
+# re-running a claim or re-uploading a file skips the repeat model call
+_RESULT_CACHE = ContentCache(max_entries=512, ttl_seconds=3600)
+
+# EXIF fields carried into each photo's evidence (has_exif is added separately).
+# The reader omits fields it could not find, so missing ones are recorded as None.
+EXIF_SUMMARY_FIELDS = ("timestamp", "camera_make", "camera_model", "gps_latitude", "gps_longitude")
+
+
+@contextmanager
+def _debug_timer(message: str) -> Iterator[None]:
+    """Log the block's elapsed seconds at DEBUG; a no-op when DEBUG is off."""
+    if not logger.isEnabledFor(logging.DEBUG):
+        yield
+        return
+    start = time.perf_counter()
+    yield
+    logger.debug(message, time.perf_counter() - start)
+
+
+def _largest_first(files: List[tuple]) -> List[int]:
+    """Return indices of (filename, bytes) tuples ordered by size, largest first."""
+    return sorted(range(len(files)), key=lambda i: len(files[i][1]), reverse=True)
+
+
+# Plugins are stateless apart from their Bedrock client, so every curator in
+# the process shares one instance of each. Construction stays lazy because the
+# plugins raise ImportError when their optional dependencies are missing.
+@lru_cache(maxsize=None)
+def _shared_image_analyzer(bedrock_client: BedrockClient) -> ImageAnalyzerPlugin:
+    """Return the process-wide ImageAnalyzerPlugin for a Bedrock client."""
+    return ImageAnalyzerPlugin(bedrock_client)
+
+
+@lru_cache(maxsize=None)
+def _shared_invoice_parser(bedrock_client: BedrockClient) -> InvoiceParserPlugin:
+    """Return the process-wide InvoiceParserPlugin for a Bedrock client."""
+    return InvoiceParserPlugin(bedrock_client)
+
+
+@lru_cache(maxsize=1)
+def _shared_pdf_extractor() -> PDFExtractorPlugin:
+    """Return the process-wide PDFExtractorPlugin."""
+    return PDFExtractorPlugin()
+
+
+@lru_cache(maxsize=1)
+def _shared_exif_reader() -> EXIFReaderPlugin:
+    """Return the process-wide EXIFReaderPlugin."""
+    return EXIFReaderPlugin()
+
+# Filename keywords marking a PDF as a form that needs vision analysis
+_FORM_FILENAME_RE = re.compile(r"form|application|claim|report|worksheet", re.IGNORECASE)
+
+# Text-layer length above which a keyword-named PDF without fillable fields is
+# treated as a narrative document and read with text extraction, not vision
+FORM_TEXT_MIN_CHARS = 1000
+
+
+def _has_form_fields(file_bytes: bytes) -> bool:
+    """Return True if a PDF declares AcroForm or XFA fillable fields."""
+    return b"/AcroForm" in file_bytes or b"/XFA" in file_bytes
+
 
 class EvidenceCuratorAgent(BaseClaimsAgent):
     """
@@ -34,6 +116,27 @@ class EvidenceCuratorAgent(BaseClaimsAgent):
     - exif_reader: Extract metadata from images
     """
     
+    # Lazily built plugins and their Bedrock client; BaseClaimsAgent holds the rest
+    __slots__ = (
+        "_nova_vision",
+        "_pdf_extractor",
+        "_exif_reader",
+        "_invoice_parser",
+        "_plugin_bedrock_client",
+    )
+    
+    # Top-level keys every evidence payload must carry, with default factories
+    _REQUIRED_EVIDENCE_FIELDS = (
+        ("evidence", list),
+        ("expense", lambda: EvidenceCuratorAgent._empty_expense()),
+        ("fnol_summary", str),
+        ("metadata", lambda: {
+            "processing_notes": [],
+            "plugin_errors": [],
+            "image_timestamps": []
+        }),
+    )
+    
     def __init__(self):
         """
         Initialize Evidence Curator agent.
@@ -72,7 +175,7 @@ class EvidenceCuratorAgent(BaseClaimsAgent):
         """
         if self._plugin_bedrock_client is None:
             config = Config.load()
-            self._plugin_bedrock_client = BedrockClient(
+            self._plugin_bedrock_client = get_default_bedrock_client(
                 region=config.aws_region,
                 model_id=config.bedrock.model_id,
                 embedding_model_id=config.bedrock.embedding_model_id,
@@ -85,28 +188,28 @@ class EvidenceCuratorAgent(BaseClaimsAgent):
     def nova_vision(self) -> ImageAnalyzerPlugin:
         """Lazy initialization of Nova Vision plugin."""
         if self._nova_vision is None:
-            self._nova_vision = ImageAnalyzerPlugin(self._get_plugin_bedrock_client())
+            self._nova_vision = _shared_image_analyzer(self._get_plugin_bedrock_client())
         return self._nova_vision
     
     @property
     def pdf_extractor(self) -> PDFExtractorPlugin:
         """Lazy initialization of PDF extractor plugin."""
         if self._pdf_extractor is None:
-            self._pdf_extractor = PDFExtractorPlugin()
+            self._pdf_extractor = _shared_pdf_extractor()
         return self._pdf_extractor
     
     @property
     def exif_reader(self) -> EXIFReaderPlugin:
         """Lazy initialization of EXIF reader plugin."""
         if self._exif_reader is None:
-            self._exif_reader = EXIFReaderPlugin()
+            self._exif_reader = _shared_exif_reader()
         return self._exif_reader
     
     @property
     def invoice_parser(self) -> InvoiceParserPlugin:
         """Lazy initialization of invoice parser plugin."""
         if self._invoice_parser is None:
-            self._invoice_parser = InvoiceParserPlugin(self._get_plugin_bedrock_client())
+            self._invoice_parser = _shared_invoice_parser(self._get_plugin_bedrock_client())
         return self._invoice_parser
     
     def _build_instructions(self) -> str:
@@ -217,7 +320,8 @@ When responding to other agents:
             claim_data = context.get("claim_data")
             
             logger.info(
-                f"Evidence Curator processing claim: {claim_data.case_id if claim_data else 'unknown'}"
+                "Evidence Curator processing claim: %s",
+                claim_data.case_id if claim_data else 'unknown'
             )
             
             # Initialize result structure
@@ -237,25 +341,24 @@ When responding to other agents:
                 self._add_processing_note(evidence_data, "No claim data provided")
                 return self._format_response(evidence_data)
             
-            # 1. Process FNOL documents
-            await self._process_fnol_files(claim_data.fnol_files, evidence_data)
-            
-            # 2. Process damage photos
-            await self._process_photos(claim_data.photos, evidence_data)
-            
-            # 3. Process invoices
-            await self._process_invoices(claim_data.invoices, evidence_data)
+            # FNOL documents, damage photos, and invoices write disjoint parts of
+            # evidence_data, so the three stages run concurrently.
+            await asyncio.gather(
+                self._process_fnol_files(claim_data.fnol_files, evidence_data),
+                self._process_photos(claim_data.photos, evidence_data),
+                self._process_invoices(claim_data.invoices, evidence_data),
+            )
             
             logger.info(
-                f"Evidence Curator completed processing: "
-                f"{len(evidence_data.get('evidence', []))} images analyzed, "
-                f"expense total: {evidence_data.get('expense', {}).get('total', 0)}"
+                "Evidence Curator completed processing: %s images analyzed, expense total: %s",
+                len(evidence_data.get('evidence', [])),
+                evidence_data.get('expense', {}).get('total', 0)
             )
             
             return self._format_response(evidence_data)
             
         except Exception as e:
-            logger.error(f"Evidence Curator failed: {str(e)}")
+            logger.error("Evidence Curator failed: %s", e)
             # Return structured error response
             error_data = self._empty_evidence_structure()
             self._add_processing_note(error_data, f"Processing failed: {str(e)}")
@@ -313,35 +416,42 @@ When responding to other agents:
             # Try to extract JSON from the response
             # The response might contain explanatory text before/after JSON
             
-            # Look for JSON object in the response
-            start_idx = response_text.find('{')
-            end_idx = response_text.rfind('}')
+            # Decode the first complete JSON object, trying each '{' in turn so
+            # brace-like fragments in surrounding prose are skipped
+            evidence_data = None
+            stripped = response_text.strip()
+            if orjson is not None and stripped.startswith('{') and stripped.endswith('}'):
+                # Common case: the whole response is the JSON object
+                try:
+                    evidence_data = orjson.loads(stripped)
+                except orjson.JSONDecodeError:
+                    evidence_data = None
+            
+            start_idx = response_text.find('{') if evidence_data is None else -1
+            while start_idx != -1:
+                try:
+                    candidate, _ = _JSON_DECODER.raw_decode(response_text, start_idx)
+                except json.JSONDecodeError:
+                    candidate = None
+                if isinstance(candidate, dict):
+                    evidence_data = candidate
+                    break
+                start_idx = response_text.find('{', start_idx + 1)
             
-            if start_idx == -1 or end_idx == -1:
+            if evidence_data is None:
                 logger.warning("No JSON found in response, returning empty structure")
+                logger.debug("Response text: %s...", response_text[:500])
                 return self._empty_evidence_structure()
             
-            json_text = response_text[start_idx:end_idx + 1]
-            
-            # Parse JSON
-            evidence_data = json.loads(json_text)
-            
-            # Validate structure
-            if "evidence" not in evidence_data:
-                evidence_data["evidence"] = []
-            
-            if "expense" not in evidence_data:
-                evidence_data["expense"] = self._empty_expense()
+            # Validate structure once here; payloads built in-process are complete
+            for key, default in self._REQUIRED_EVIDENCE_FIELDS:
+                if key not in evidence_data:
+                    evidence_data[key] = default()
             
             return evidence_data
             
-        except json.JSONDecodeError as e:
-            logger.error(f"Failed to parse JSON from response: {str(e)}")
-            logger.debug(f"Response text: {response_text[:500]}...")
-            return self._empty_evidence_structure()
-        
         except Exception as e:
-            logger.error(f"Error parsing response: {str(e)}")
+            logger.error("Error parsing response: %s", e)
             return self._empty_evidence_structure()
     
     def _empty_evidence_structure(self) -> Dict[str, Any]:
@@ -356,11 +466,14 @@ When responding to other agents:
             "expense": self._empty_expense(),
             "fnol_summary": "",
             "metadata": {
-                "processing_notes": ["Failed to extract evidence"]
+                "processing_notes": ["Failed to extract evidence"],
+                "plugin_errors": [],
+                "image_timestamps": []
             }
         }
     
-    def _empty_expense(self) -> Dict[str, Any]:
+    @staticmethod
+    def _empty_expense() -> Dict[str, Any]:
         """
         Return an empty expense structure.
         
@@ -385,6 +498,13 @@ When responding to other agents:
         notes = metadata.setdefault("processing_notes", [])
         notes.append(note)
     
+    @staticmethod
+    def _record_cache_hit(evidence_data: Dict[str, Any], kind: str, filename: str) -> None:
+        """Record that a file's plugin result was reused from the content cache."""
+        metadata = evidence_data.setdefault("metadata", {})
+        hits = metadata.setdefault("cache_hits", [])
+        hits.append({"kind": kind, "file": filename})
+    
     @staticmethod
     def _record_plugin_error(
         evidence_data: Dict[str, Any],
@@ -401,6 +521,35 @@ When responding to other agents:
             "error": str(error)
         })
     
+    async def _gather_files(self, files: List[tuple], process_one) -> List[Dict[str, Any]]:
+        """
+        Run a per-file coroutine over every upload concurrently.
+        
+        Plugin calls are bounded by the shared per-model Bedrock semaphore. Files
+        are dispatched largest first so the slowest calls start earliest, and
+        results come back in upload order so they can be merged deterministically.
+        
+        Args:
+            files: List of (filename, bytes) tuples
+            process_one: Coroutine function taking (filename, bytes) and returning an outcome dict
+            
+        Returns:
+            Outcome dicts in the same order as files
+        """
+        slot = self._bedrock_slot(self._get_plugin_bedrock_client().model_id)
+        
+        async def bounded(filename: str, file_bytes: bytes) -> Dict[str, Any]:
+            async with slot:
+                return await process_one(filename, file_bytes)
+        
+        order = _largest_first(files)
+        outcomes = await asyncio.gather(*(bounded(*files[i]) for i in order))
+        
+        results: List[Dict[str, Any]] = [{}] * len(files)
+        for i, outcome in zip(order, outcomes):
+            results[i] = outcome
+        return results
+    
     async def _process_fnol_files(self, fnol_files: List[tuple], evidence_data: Dict[str, Any]) -> None:
         """
         Process FNOL documents using appropriate plugins.
@@ -409,178 +558,339 @@ When responding to other agents:
             fnol_files: List of (filename, bytes) tuples
             evidence_data: Evidence data structure to update
         """
+        # Headings and texts are kept as separate pieces and joined once at the end,
+        # so large extracted texts are copied a single time
         fnol_text_parts = []
+        documents_processed = 0
         
-        logger.info(f"Starting FNOL processing: {len(fnol_files)} files")
+        logger.info("Starting FNOL processing: %s files", len(fnol_files))
         
-        for filename, file_bytes in fnol_files:
-            try:
-                start_time = time.time()
-                logger.info(f"Processing FNOL file: {filename} ({len(file_bytes)} bytes)")
-                
-                # Check if it's a form PDF that needs vision analysis
-                if self._is_form_pdf(filename, file_bytes):
-                    logger.debug(f"Processing {filename} as form PDF using Nova Pro vision")
-                    
-                    # Use Nova Pro vision for form field extraction
-                    plugin_start = time.time()
-                    form_data = await self.nova_vision.extract_pdf_form_fields(
-                        pdf_bytes=file_bytes,
-                        pdf_name=filename
-                    )
-                    plugin_time = time.time() - plugin_start
-                    logger.debug(f"Nova Pro form extraction completed in {plugin_time:.3f}s")
-                    
-                    evidence_data["metadata"]["form_data"] = form_data
-                    
-                    # Add form fields to FNOL summary
-                    if form_data.get("fields"):
-                        form_summary = self._format_form_fields(form_data["fields"])
-                        fnol_text_parts.append(f"Form fields from {filename}:\n{form_summary}")
-                        logger.debug(f"Extracted {len(form_data['fields'])} form fields from {filename}")
-                else:
-                    logger.debug(f"Processing {filename} as narrative PDF using text extraction")
-                    
-                    # Use text extraction for narrative PDFs
-                    plugin_start = time.time()
-                    text = self.pdf_extractor.extract_text(
-                        pdf_bytes=file_bytes,
-                        include_page_numbers=False
-                    )
-                    plugin_time = time.time() - plugin_start
-                    logger.debug(f"PDF text extraction completed in {plugin_time:.3f}s")
-                    
-                    if text and text.strip():
-                        fnol_text_parts.append(f"Content from {filename}:\n{text}")
-                        logger.debug(f"Extracted {len(text)} characters of text from {filename}")
-                
-                total_time = time.time() - start_time
-                logger.info(f"Successfully processed FNOL: {filename} in {total_time:.3f}s")
-                self._add_processing_note(
-                    evidence_data,
-                    f"Successfully processed FNOL: {filename}"
-                )
-                
-            except Exception as e:
-                logger.error(f"Failed to process FNOL file {filename}: {str(e)}")
-                logger.error(f"File details: size={len(file_bytes)} bytes")
+        for filename, outcome in zip(
+            (filename for filename, _ in fnol_files),
+            await self._gather_files(fnol_files, self._process_fnol_file),
+        ):
+            if "error" in outcome:
                 self._record_plugin_error(
                     evidence_data,
                     plugin="pdf_extractor/nova_vision",
                     filename=filename,
-                    error=e
+                    error=outcome["error"]
                 )
                 self._add_processing_note(
                     evidence_data,
                     f"Failed to process FNOL: {filename}"
                 )
+                continue
+            
+            if "form_data" in outcome:
+                evidence_data["metadata"]["form_data"] = outcome["form_data"]
+            if outcome.get("text_part"):
+                if fnol_text_parts:
+                    fnol_text_parts.append("\n\n")
+                fnol_text_parts.extend(outcome["text_part"])
+                documents_processed += 1
+            if outcome.get("cache_hit"):
+                self._record_cache_hit(evidence_data, "fnol_form", filename)
+            self._add_processing_note(
+                evidence_data,
+                f"Successfully processed FNOL: {filename}"
+            )
         
         # Combine all FNOL text
-        evidence_data["fnol_summary"] = "\n\n".join(fnol_text_parts)
-        logger.info(f"FNOL processing complete: {len(fnol_text_parts)} documents processed")
+        evidence_data["fnol_summary"] = "".join(fnol_text_parts)
+        logger.info("FNOL processing complete: %s documents processed", documents_processed)
     
-    async def _process_photos(self, photos: List[tuple], evidence_data: Dict[str, Any]) -> None:
+    async def _process_fnol_file(self, filename: str, file_bytes: bytes) -> Dict[str, Any]:
         """
-        Process damage photos using EXIF reader and Nova Pro vision.
+        Extract one FNOL document.
         
         Args:
-            photos: List of (filename, bytes) tuples
-            evidence_data: Evidence data structure to update
+            filename: Uploaded file name
+            file_bytes: File contents
+            
+        Returns:
+            Outcome dict with optional 'form_data' and 'text_part' (heading, text)
+            pieces, or 'error'
         """
-        logger.info(f"Starting photo processing: {len(photos)} images")
-        
-        for filename, image_bytes in photos:
-            try:
-                start_time = time.time()
-                logger.info(f"Processing photo: {filename} ({len(image_bytes)} bytes)")
-                
-                # Extract EXIF metadata first
-                logger.debug(f"Extracting EXIF metadata from {filename}")
-                exif_start = time.time()
-                exif_data = self.exif_reader.extract_metadata(image_bytes=image_bytes)
-                exif_time = time.time() - exif_start
-                logger.debug(f"EXIF extraction completed in {exif_time:.3f}s, has_exif: {exif_data.get('has_exif', False)}")
+        outcome: Dict[str, Any] = {}
+        try:
+            start_time = time.perf_counter()
+            logger.info("Processing FNOL file: %s (%s bytes)", filename, len(file_bytes))
+            
+            # Check if it's a form PDF that needs vision analysis. A keyword-named
+            # PDF without fillable fields whose text layer already holds prose
+            # goes to cheap text extraction instead.
+            text = None
+            use_vision = self._is_form_pdf(filename, file_bytes)
+            if use_vision and not _has_form_fields(file_bytes):
+                try:
+                    text = await self._extract_fnol_text(file_bytes) or ""
+                except Exception as e:
+                    logger.debug("Text layer probe failed for %s: %s", filename, e)
+                    text = ""
+                if len(text.strip()) >= FORM_TEXT_MIN_CHARS:
+                    logger.debug("%s has a %s-character text layer, skipping vision", filename, len(text))
+                    use_vision = False
+            
+            if use_vision:
+                logger.debug("Processing %s as form PDF using Nova Pro vision", filename)
                 
-                # Store timestamp only if EXIF data is available
-                timestamp = exif_data.get("timestamp")
-                if timestamp:
-                    evidence_data["metadata"]["image_timestamps"].append({
-                        "filename": filename,
-                        "timestamp": timestamp,
-                        "source": "exif",
-                        "has_exif": True
-                    })
-                    logger.debug(f"Found EXIF timestamp in {filename}: {timestamp}")
+                # Use Nova Pro vision for form field extraction
+                digest = _RESULT_CACHE.digest(file_bytes)
+                form_data = _RESULT_CACHE.get("fnol_form", digest)
+                if form_data is not None:
+                    outcome["cache_hit"] = True
                 else:
-                    # Report missing EXIF without fallback - let reviewer judge significance
-                    evidence_data["metadata"]["image_timestamps"].append({
-                        "filename": filename,
-                        "timestamp": None,
-                        "source": "unavailable",
-                        "has_exif": exif_data.get("has_exif", False),
-                        "note": "No EXIF timestamp available - image may have been processed or edited"
-                    })
-                    logger.debug(f"No EXIF timestamp in {filename}, marked as unavailable")
-                
-                # Analyze damage using Nova Pro vision
-                logger.debug(f"Analyzing damage in {filename} using Nova Pro vision")
-                analysis_start = time.time()
-                analysis = await self.nova_vision.analyze_image(
-                    image_bytes=image_bytes,
-                    image_name=filename
-                )
-                analysis_time = time.time() - analysis_start
-                logger.debug(f"Damage analysis completed in {analysis_time:.3f}s")
+                    with _debug_timer("Nova Pro form extraction completed in %.3fs"):
+                        form_data = await self.nova_vision.extract_pdf_form_fields(
+                            pdf_bytes=file_bytes,
+                            pdf_name=filename
+                        )
+                    _RESULT_CACHE.put("fnol_form", digest, form_data)
                 
-                # Ensure the analysis uses the actual filename, not a placeholder
-                if analysis.get("image_name") != filename:
-                    logger.warning(f"Analysis returned wrong image name: {analysis.get('image_name')} vs {filename}")
-                    analysis["image_name"] = filename
+                outcome["form_data"] = form_data
                 
-                # Combine analysis with EXIF data
-                image_evidence = {
-                    "image_name": filename,  # Use actual filename
-                    "observations": analysis.get("observations", []),
-                    "global_assessment": analysis.get("global_assessment", {}),
-                    "chronology": analysis.get("chronology", {}),
-                    "exif_data": {
-                        "timestamp": exif_data.get("timestamp"),
-                        "camera_make": exif_data.get("camera_make"),
-                        "camera_model": exif_data.get("camera_model"),
-                        "gps_latitude": exif_data.get("gps_latitude"),
-                        "gps_longitude": exif_data.get("gps_longitude"),
-                        "has_exif": exif_data.get("has_exif", False)
-                    }
-                }
+                # Add form fields to FNOL summary
+                if form_data.get("fields"):
+                    form_summary = self._format_form_fields(form_data["fields"])
+                    outcome["text_part"] = (f"Form fields from {filename}:\n", form_summary)
+                    logger.debug("Extracted %s form fields from %s", len(form_data['fields']), filename)
+            else:
+                logger.debug("Processing %s as narrative PDF using text extraction", filename)
                 
-                evidence_data["evidence"].append(image_evidence)
+                # Use text extraction for narrative PDFs; it runs on a worker thread so
+                # the other uploads' Bedrock calls keep progressing meanwhile
+                if text is None:
+                    text = await self._extract_fnol_text(file_bytes)
                 
-                total_time = time.time() - start_time
-                observations_count = len(analysis.get("observations", []))
-                logger.info(
-                    f"Successfully analyzed photo: {filename} - "
-                    f"{observations_count} observations in {total_time:.3f}s"
-                )
-                self._add_processing_note(
-                    evidence_data,
-                    f"Successfully analyzed photo: {filename}"
-                )
-                
-            except Exception as e:
-                logger.error(f"Failed to process photo {filename}: {str(e)}")
-                logger.error(f"Photo details: size={len(image_bytes)} bytes")
+                if text and text.strip():
+                    outcome["text_part"] = (f"Content from {filename}:\n", text)
+                    logger.debug("Extracted %s characters of text from %s", len(text), filename)
+            
+            total_time = time.perf_counter() - start_time
+            logger.info("Successfully processed FNOL: %s in %.3fs", filename, total_time)
+            return outcome
+            
+        except Exception as e:
+            logger.error("Failed to process FNOL file %s: %s", filename, e)
+            logger.error("File details: size=%s bytes", len(file_bytes))
+            return {"error": e}
+    
+    async def _process_photos(self, photos: List[tuple], evidence_data: Dict[str, Any]) -> None:
+        """
+        Process damage photos using EXIF reader and Nova Pro vision.
+        
+        Args:
+            photos: List of (filename, bytes) tuples
+            evidence_data: Evidence data structure to update
+        """
+        logger.info("Starting photo processing: %s images", len(photos))
+        
+        # Photos are analyzed PHOTO_BATCH_SIZE per Nova Pro request; batches run
+        # concurrently, largest photos first, and outcomes are restored to upload order
+        order = _largest_first(photos)
+        batch_orders = [order[i:i + PHOTO_BATCH_SIZE] for i in range(0, len(order), PHOTO_BATCH_SIZE)]
+        batch_outcomes = await asyncio.gather(
+            *(self._process_photo_batch([photos[i] for i in batch_order]) for batch_order in batch_orders)
+        )
+        
+        photo_outcomes: List[Dict[str, Any]] = [{}] * len(photos)
+        for batch_order, outcomes in zip(batch_orders, batch_outcomes):
+            for i, outcome in zip(batch_order, outcomes):
+                photo_outcomes[i] = outcome
+        
+        image_timestamps = evidence_data["metadata"]["image_timestamps"]
+        image_evidence = evidence_data["evidence"]
+        for filename, outcome in zip(
+            (filename for filename, _ in photos),
+            photo_outcomes,
+        ):
+            # The timestamp entry is recorded even if vision analysis later failed.
+            if "timestamp_entry" in outcome:
+                image_timestamps.append(outcome["timestamp_entry"])
+            
+            if "error" in outcome:
                 self._record_plugin_error(
                     evidence_data,
                     plugin="exif_reader/nova_vision",
                     filename=filename,
-                    error=e
+                    error=outcome["error"]
                 )
                 self._add_processing_note(
                     evidence_data,
                     f"Failed to analyze photo: {filename}"
                 )
+                continue
+            
+            image_evidence.append(outcome["image_evidence"])
+            if outcome.get("cache_hit"):
+                self._record_cache_hit(evidence_data, "photo", filename)
+            self._add_processing_note(
+                evidence_data,
+                f"Successfully analyzed photo: {filename}"
+            )
+        
+        logger.info("Photo processing complete: %s images analyzed", len(image_evidence))
+    
+    async def _process_photo_batch(self, batch: List[tuple]) -> List[Dict[str, Any]]:
+        """
+        Read EXIF metadata and run damage analysis for a batch of photos.
+        
+        EXIF parsing is local CPU work and runs on worker threads while one
+        multi-image Nova Pro request analyzes the whole batch. Photos the batch
+        call fails to cover are re-analyzed one at a time.
+        
+        Args:
+            batch: List of (filename, bytes) tuples
+            
+        Returns:
+            Outcome dicts in batch order, each with 'timestamp_entry' and
+            'image_evidence', or 'error'
+        """
+        slot = self._bedrock_slot(self._get_plugin_bedrock_client().model_id)
+        
+        digests = [_RESULT_CACHE.digest(image_bytes) for _, image_bytes in batch]
+        results: List[Any] = [_RESULT_CACHE.get("photo", digest) for digest in digests]
+        cache_hits = [result is not None for result in results]
+        
+        async def analyze_batch() -> List[Any]:
+            pending = [i for i, result in enumerate(results) if result is None]
+            if pending:
+                try:
+                    async with slot:
+                        analyzed = await self.nova_vision.analyze_images_batch([batch[i] for i in pending])
+                except Exception as e:
+                    logger.warning("Batched photo analysis failed, analyzing individually: %s", e)
+                    analyzed = [None] * len(pending)
+                for i, result in zip(pending, analyzed):
+                    results[i] = result
+            
+            async def analyze_one(filename: str, image_bytes: bytes) -> Dict[str, Any]:
+                async with slot:
+                    return await self.nova_vision.analyze_image(
+                        image_bytes=image_bytes,
+                        image_name=filename
+                    )
+            
+            missing = [i for i, result in enumerate(results) if result is None]
+            if missing:
+                retried = await asyncio.gather(
+                    *(analyze_one(*batch[i]) for i in missing),
+                    return_exceptions=True
+                )
+                for i, result in zip(missing, retried):
+                    results[i] = result
+            
+            for i in pending:
+                if isinstance(results[i], dict):
+                    _RESULT_CACHE.put("photo", digests[i], results[i])
+            return results
+        
+        start_time = time.perf_counter()
+        for filename, image_bytes in batch:
+            logger.info("Processing photo: %s (%s bytes)", filename, len(image_bytes))
         
-        logger.info(f"Photo processing complete: {len(evidence_data['evidence'])} images analyzed")
+        exif_results, analyses = await asyncio.gather(
+            asyncio.gather(
+                *(asyncio.to_thread(self.exif_reader.extract_metadata, image_bytes=image_bytes)
+                  for _, image_bytes in batch),
+                return_exceptions=True
+            ),
+            analyze_batch()
+        )
+        total_time = time.perf_counter() - start_time
+        
+        outcomes = [
+            self._build_photo_outcome(filename, image_bytes, exif_data, analysis, total_time)
+            for (filename, image_bytes), exif_data, analysis in zip(batch, exif_results, analyses)
+        ]
+        for outcome, cache_hit in zip(outcomes, cache_hits):
+            if cache_hit:
+                outcome["cache_hit"] = True
+        return outcomes
+    
+    def _build_photo_outcome(
+        self,
+        filename: str,
+        image_bytes: bytes,
+        exif_data: Any,
+        analysis: Any,
+        total_time: float
+    ) -> Dict[str, Any]:
+        """
+        Combine one photo's EXIF metadata and damage analysis into an outcome.
+        
+        Args:
+            filename: Uploaded file name
+            image_bytes: Image contents
+            exif_data: EXIF metadata dict, or the exception extraction raised
+            analysis: Analysis dict, or the exception analysis raised
+            total_time: Wall time spent on the photo's batch
+            
+        Returns:
+            Outcome dict with 'timestamp_entry' and 'image_evidence', or 'error'
+        """
+        outcome: Dict[str, Any] = {}
+        try:
+            if isinstance(exif_data, BaseException):
+                raise exif_data
+            has_exif = exif_data.get("has_exif", False)
+            logger.debug("EXIF extraction completed for %s, has_exif: %s", filename, has_exif)
+            
+            # Store timestamp only if EXIF data is available
+            timestamp = exif_data.get("timestamp")
+            if timestamp:
+                outcome["timestamp_entry"] = {
+                    "filename": filename,
+                    "timestamp": timestamp,
+                    "source": "exif",
+                    "has_exif": True
+                }
+                logger.debug("Found EXIF timestamp in %s: %s", filename, timestamp)
+            else:
+                # Report missing EXIF without fallback - let reviewer judge significance
+                outcome["timestamp_entry"] = {
+                    "filename": filename,
+                    "timestamp": None,
+                    "source": "unavailable",
+                    "has_exif": has_exif,
+                    "note": "No EXIF timestamp available - image may have been processed or edited"
+                }
+                logger.debug("No EXIF timestamp in %s, marked as unavailable", filename)
+            
+            # The timestamp is kept even when the vision call failed
+            if isinstance(analysis, BaseException):
+                raise analysis
+            
+            # Ensure the analysis uses the actual filename, not a placeholder
+            if analysis.get("image_name") != filename:
+                logger.warning("Analysis returned wrong image name: %s vs %s", analysis.get('image_name'), filename)
+                analysis["image_name"] = filename
+            
+            # Combine analysis with EXIF data
+            outcome["image_evidence"] = {
+                "image_name": filename,  # Use actual filename
+                "observations": analysis.get("observations", []),
+                "global_assessment": analysis.get("global_assessment", {}),
+                "chronology": analysis.get("chronology", {}),
+                "exif_data": {
+                    **{field: exif_data.get(field) for field in EXIF_SUMMARY_FIELDS},
+                    "has_exif": has_exif
+                }
+            }
+            
+            observations_count = len(analysis.get("observations", []))
+            logger.info(
+                "Successfully analyzed photo: %s - %s observations in %.3fs",
+                filename, observations_count, total_time
+            )
+            return outcome
+            
+        except Exception as e:
+            logger.error("Failed to process photo %s: %s", filename, e)
+            logger.error("Photo details: size=%s bytes", len(image_bytes))
+            outcome["error"] = e
+            return outcome
     
     async def _process_invoices(self, invoices: List[tuple], evidence_data: Dict[str, Any]) -> None:
         """
@@ -595,60 +905,46 @@ When responding to other agents:
         primary_vendor = None
         primary_invoice = None
         
-        logger.info(f"Starting invoice processing: {len(invoices)} documents")
+        logger.info("Starting invoice processing: %s documents", len(invoices))
         
-        for filename, invoice_bytes in invoices:
-            try:
-                start_time = time.time()
-                logger.info(f"Processing invoice: {filename} ({len(invoice_bytes)} bytes)")
-                
-                # Use Nova Pro vision for invoice parsing
-                logger.debug(f"Parsing invoice {filename} using Nova Pro vision")
-                parse_start = time.time()
-                expense_data = await self.invoice_parser.parse_invoice(
-                    document_bytes=invoice_bytes,
-                    document_name=filename
-                )
-                parse_time = time.time() - parse_start
-                logger.debug(f"Invoice parsing completed in {parse_time:.3f}s")
-                
-                # Set primary invoice data from first successful parse
-                if not primary_invoice and expense_data.get("vendor") != "Unknown Vendor":
-                    primary_invoice = expense_data
-                    primary_vendor = expense_data.get("vendor")
-                    logger.debug(f"Set primary vendor: {primary_vendor}")
-                
-                # Accumulate line items and totals
-                line_items = expense_data.get("line_items", [])
-                all_line_items.extend(line_items)
-                
-                invoice_total = expense_data.get("total", 0.0)
-                if isinstance(invoice_total, (int, float)):
-                    total_amount += invoice_total
-                
-                total_time = time.time() - start_time
-                logger.info(
-                    f"Successfully parsed invoice: {filename} - vendor: {expense_data.get('vendor')}, "
-                    f"total: {invoice_total}, line_items: {len(line_items)} in {total_time:.3f}s"
-                )
-                self._add_processing_note(
-                    evidence_data,
-                    f"Successfully parsed invoice: {filename}"
-                )
-                
-            except Exception as e:
-                logger.error(f"Failed to process invoice {filename}: {str(e)}")
-                logger.error(f"Invoice details: size={len(invoice_bytes)} bytes")
+        for filename, outcome in zip(
+            (filename for filename, _ in invoices),
+            await self._gather_files(invoices, self._process_invoice),
+        ):
+            if "error" in outcome:
                 self._record_plugin_error(
                     evidence_data,
                     plugin="invoice_parser",
                     filename=filename,
-                    error=e
+                    error=outcome["error"]
                 )
                 self._add_processing_note(
                     evidence_data,
                     f"Failed to parse invoice: {filename}"
                 )
+                continue
+            
+            expense_data = outcome["expense_data"]
+            
+            # Set primary invoice data from first successful parse (in upload order)
+            if not primary_invoice and expense_data.get("vendor") != "Unknown Vendor":
+                primary_invoice = expense_data
+                primary_vendor = expense_data.get("vendor")
+                logger.debug("Set primary vendor: %s", primary_vendor)
+            
+            # Accumulate line items and totals
+            all_line_items.extend(expense_data.get("line_items", []))
+            
+            invoice_total = expense_data.get("total", 0.0)
+            if isinstance(invoice_total, (int, float)):
+                total_amount += invoice_total
+            
+            if outcome.get("cache_hit"):
+                self._record_cache_hit(evidence_data, "invoice", filename)
+            self._add_processing_note(
+                evidence_data,
+                f"Successfully parsed invoice: {filename}"
+            )
         
         # Build consolidated expense data
         if primary_invoice:
@@ -662,12 +958,73 @@ When responding to other agents:
                 "total": total_amount,
                 "line_items": all_line_items
             }
-            logger.info(f"Consolidated expense data: vendor={primary_vendor}, total={total_amount}, items={len(all_line_items)}")
+            logger.info("Consolidated expense data: vendor=%s, total=%s, items=%s", primary_vendor, total_amount, len(all_line_items))
         else:
             evidence_data["expense"] = self._empty_expense()
             logger.warning("No valid invoices found, using empty expense structure")
         
-        logger.info(f"Invoice processing complete: {len(invoices)} documents processed")
+        logger.info("Invoice processing complete: %s documents processed", len(invoices))
+    
+    async def _process_invoice(self, filename: str, invoice_bytes: bytes) -> Dict[str, Any]:
+        """
+        Parse one invoice with Nova Pro vision.
+        
+        Args:
+            filename: Uploaded file name
+            invoice_bytes: Invoice contents
+            
+        Returns:
+            Outcome dict with 'expense_data', or 'error'
+        """
+        try:
+            start_time = time.perf_counter()
+            logger.info("Processing invoice: %s (%s bytes)", filename, len(invoice_bytes))
+            
+            # Use Nova Pro vision for invoice parsing
+            logger.debug("Parsing invoice %s using Nova Pro vision", filename)
+            digest = _RESULT_CACHE.digest(invoice_bytes)
+            expense_data = _RESULT_CACHE.get("invoice", digest)
+            cache_hit = expense_data is not None
+            if not cache_hit:
+                with _debug_timer("Invoice parsing completed in %.3fs"):
+                    expense_data = await self.invoice_parser.parse_invoice(
+                        document_bytes=invoice_bytes,
+                        document_name=filename
+                    )
+                _RESULT_CACHE.put("invoice", digest, expense_data)
+            
+            total_time = time.perf_counter() - start_time
+            logger.info(
+                "Successfully parsed invoice: %s - vendor: %s, total: %s, line_items: %s in %.3fs",
+                filename,
+                expense_data.get('vendor'),
+                expense_data.get('total', 0.0),
+                len(expense_data.get('line_items', [])),
+                total_time
+            )
+            return {"expense_data": expense_data, "cache_hit": cache_hit}
+            
+        except Exception as e:
+            logger.error("Failed to process invoice %s: %s", filename, e)
+            logger.error("Invoice details: size=%s bytes", len(invoice_bytes))
+            return {"error": e}
+    
+    async def _extract_fnol_text(self, file_bytes: bytes) -> str:
+        """
+        Extract a PDF's text layer on a worker thread.
+        
+        Args:
+            file_bytes: PDF bytes
+            
+        Returns:
+            Extracted text
+        """
+        with _debug_timer("PDF text extraction completed in %.3fs"):
+            return await asyncio.to_thread(
+                self.pdf_extractor.extract_text,
+                pdf_bytes=file_bytes,
+                include_page_numbers=False
+            )
     
     def _is_form_pdf(self, filename: str, file_bytes: bytes) -> bool:
         """
@@ -681,16 +1038,9 @@ When responding to other agents:
             True if it appears to be a form PDF
         """
         # Simple heuristic: check filename for form-related keywords
-        form_keywords = ["form", "application", "claim", "report", "worksheet"]
-        filename_lower = filename.lower()
-        
-        for keyword in form_keywords:
-            if keyword in filename_lower:
-                return True
-        
         # Could add more sophisticated detection here
         # For now, default to text extraction for most PDFs
-        return False
+        return _FORM_FILENAME_RE.search(filename) is not None
     
     def _format_form_fields(self, fields: Dict[str, Any]) -> str:
         """
@@ -713,6 +1063,9 @@ When responding to other agents:
         """
         Format the final response using ResponseFormatter.
         
+        Callers pass payloads that already carry every top-level field (built in
+        invoke, by _empty_evidence_structure, or validated by _parse_response).
+        
         Args:
             evidence_data: Raw evidence data
             
@@ -720,55 +1073,45 @@ When responding to other agents:
             Formatted response dictionary
         """
         try:
-            # Ensure all required fields are present
-            if "evidence" not in evidence_data:
-                evidence_data["evidence"] = []
-            
-            if "expense" not in evidence_data:
-                evidence_data["expense"] = self._empty_expense()
-            
-            if "fnol_summary" not in evidence_data:
-                evidence_data["fnol_summary"] = ""
-            
-            if "metadata" not in evidence_data:
-                evidence_data["metadata"] = {
-                    "processing_notes": [],
-                    "plugin_errors": [],
-                    "image_timestamps": []
-                }
-            
             # Log the evidence data for debugging
-            logger.info(f"Evidence Curator returning {len(evidence_data.get('evidence', []))} image analyses")
-            for img_evidence in evidence_data.get("evidence", []):
-                logger.info(f"  - Image: {img_evidence.get('image_name', 'unknown')}")
-                logger.debug(f"    Observations: {len(img_evidence.get('observations', []))}")
-                logger.debug(f"    EXIF timestamp: {img_evidence.get('exif_data', {}).get('timestamp', 'none')}")
-            
-            # Log expense data
-            expense = evidence_data.get("expense", {})
-            logger.info(f"  - Expense: vendor={expense.get('vendor', 'none')}, total={expense.get('total', 0)}")
-            
-            # Log metadata
-            metadata = evidence_data.get("metadata", {})
-            logger.info(f"  - Processing notes: {len(metadata.get('processing_notes', []))}")
-            logger.info(f"  - Plugin errors: {len(metadata.get('plugin_errors', []))}")
-            logger.info(f"  - Image timestamps: {len(metadata.get('image_timestamps', []))}")
-            
-            # Use ResponseFormatter to ensure consistent JSON output
-            formatted_response = ResponseFormatter.format_json_response(
-                data=evidence_data
-            )
+            if logger.isEnabledFor(logging.INFO):
+                evidence_list = evidence_data["evidence"]
+                logger.info("Evidence Curator returning %s image analyses", len(evidence_list))
+                debug = logger.isEnabledFor(logging.DEBUG)
+                for img_evidence in evidence_list:
+                    logger.info("  - Image: %s", img_evidence.get('image_name', 'unknown'))
+                    if debug:
+                        logger.debug("    Observations: %s", len(img_evidence.get('observations') or ()))
+                        logger.debug(
+                            "    EXIF timestamp: %s",
+                            (img_evidence.get('exif_data') or _EMPTY_MAPPING).get('timestamp', 'none')
+                        )
+                
+                # Log expense data
+                expense = evidence_data["expense"]
+                logger.info("  - Expense: vendor=%s, total=%s", expense.get('vendor', 'none'), expense.get('total', 0))
+                
+                # Log metadata
+                metadata = evidence_data["metadata"]
+                logger.info("  - Processing notes: %s", len(metadata.get('processing_notes') or ()))
+                logger.info("  - Plugin errors: %s", len(metadata.get('plugin_errors') or ()))
+                logger.info("  - Image timestamps: %s", len(metadata.get('image_timestamps') or ()))
             
-            # Log the formatted response for debugging
-            logger.debug(f"Formatted evidence response length: {len(formatted_response)}")
-            logger.debug(f"Formatted evidence response preview: {formatted_response[:300]}...")
+            # The delimited JSON is only used for debug output, so skip
+            # serializing the whole payload unless debug logging is on
+            if logger.isEnabledFor(logging.DEBUG):
+                formatted_response = ResponseFormatter.format_json_response(
+                    data=evidence_data
+                )
+                logger.debug("Formatted evidence response length: %s", len(formatted_response))
+                logger.debug("Formatted evidence response preview: %s...", formatted_response[:300])
             
             # For the invoke method, we return the data directly
             # The formatted response would be used if this were a string response
             return evidence_data
             
         except Exception as e:
-            logger.error(f"Failed to format response: {str(e)}")
+            logger.error("Failed to format response: %s", e)
             return evidence_data
     
     async def clarify_evidence(
@@ -795,5 +1138,5 @@ When responding to other agents:
             return response_text
             
         except Exception as e:
-            logger.error(f"Failed to clarify evidence: {str(e)}")
+            logger.error("Failed to clarify evidence: %s", e)
             return f"I apologize, but I encountered an error while clarifying the evidence: {str(e)}"
@@ -7,8 +7,69 @@ from typing import Any, Dict, List, Optional
 from .base import BaseClaimsAgent
 from ..utils.response_formatter import ResponseFormatter
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+_JSON_DECODER = json.JSONDecoder()
+
+# Fields a parsed decision must carry, with default factories (fresh containers
+# per decision, since callers mutate them)
+_DECISION_DEFAULTS = (
+    ("coverage_position", lambda: "Deny"),
+    ("rationale", lambda: "Unable to determine coverage"),
+    ("citations", list),
+    ("sensitivity", lambda: "Additional evidence needed"),
+    ("coverage_details", dict),
+)
+
+_VALID_POSITIONS = frozenset(("Pay", "Partial", "Deny"))
+
+_COVERAGE_DETAIL_DEFAULTS = (
+    ("covered_items", list),
+    ("excluded_items", list),
+    ("limitations", list),
+    ("deductible_applies", lambda: False),
+    ("estimated_covered_amount", lambda: 0.0),
+)
+
+# Fixed instructions closing every initial interpretation message
+_TASK_FOOTER = "\n".join([
+    "",
+    "",
+    "TASK:",
+    "Please analyze this claim and provide a coverage determination.",
+    "",
+    "Use policy_retriever to query the policy knowledge base for relevant clauses.",
+    "Consider both coverage grants and applicable exclusions.",
+    "Provide a detailed rationale with specific policy citations.",
+    "",
+    "Return a complete JSON object with your coverage decision."
+])
+
+
+def _safe_float(value: Any, default: float = 0.0) -> float:
+    """Convert a model-supplied number to float, falling back on None or junk."""
+    if value is None:
+        return default
+    try:
+        return float(value)
+    except (ValueError, TypeError):
+        return default
+
+
+def _safe_int(value: Any, default: int) -> int:
+    """Convert a model-supplied count to int, falling back on missing, zero or junk."""
+    if not value:
+        return default
+    try:
+        return int(value)
+    except (ValueError, TypeError):
+        return default
+
 
 class PolicyInterpreterAgent(BaseClaimsAgent):
     """
@@ -28,6 +89,9 @@ class PolicyInterpreterAgent(BaseClaimsAgent):
     by the LLM's reasoning capabilities.
     """
     
+    # No per-instance state beyond BaseClaimsAgent's slots
+    __slots__ = ()
+    
     def __init__(self):
         """
         Initialize Policy Interpreter agent.
@@ -166,7 +230,8 @@ When responding to other agents:
             conversation_history = context.get("conversation_history", [])
             
             logger.info(
-                f"Policy Interpreter analyzing claim: {claim_data.case_id if claim_data else 'unknown'}"
+                "Policy Interpreter analyzing claim: %s",
+                claim_data.case_id if claim_data else 'unknown'
             )
             
             # Build the initial message with evidence and claim information
@@ -182,25 +247,28 @@ When responding to other agents:
             decision_data = self._parse_response(response_text)
             
             logger.info(
-                f"Policy Interpreter decision: {decision_data.get('coverage_position', 'unknown')} "
-                f"with {len(decision_data.get('citations', []))} citations"
+                "Policy Interpreter decision: %s with %s citations",
+                decision_data.get('coverage_position', 'unknown'),
+                len(decision_data.get('citations', []))
             )
             
-            # Use ResponseFormatter to ensure consistent JSON output
-            try:
-                formatted_response = ResponseFormatter.format_json_response(decision_data)
-                logger.debug("Decision data formatted with ResponseFormatter")
-                
-                # Log the formatted response for debugging
-                logger.debug(f"Formatted decision response: {formatted_response[:500]}...")
-                
-            except Exception as e:
-                logger.warning(f"Failed to format response with ResponseFormatter: {str(e)}")
+            # The delimited JSON is only used for debug output, so skip
+            # serializing the decision unless debug logging is on
+            if logger.isEnabledFor(logging.DEBUG):
+                try:
+                    formatted_response = ResponseFormatter.format_json_response(decision_data)
+                    logger.debug("Decision data formatted with ResponseFormatter")
+                    
+                    # Log the formatted response for debugging
+                    logger.debug("Formatted decision response: %s...", formatted_response[:500])
+                    
+                except Exception as e:
+                    logger.warning("Failed to format response with ResponseFormatter: %s", e)
             
             return decision_data
             
         except Exception as e:
-            logger.error(f"Policy Interpreter failed: {str(e)}")
+            logger.error("Policy Interpreter failed: %s", e)
             raise
     
     def _build_initial_message(
@@ -245,50 +313,38 @@ When responding to other agents:
         # Include ALL image evidence details (not just first 3)
         evidence_list = evidence_data.get("evidence", [])
         if evidence_list:
-            message_parts.append(f"\nDamage Photos Analyzed: {len(evidence_list)}")
+            append = message_parts.append
+            append(f"\nDamage Photos Analyzed: {len(evidence_list)}")
             for img_evidence in evidence_list:
-                img_name = img_evidence.get("image_name", "unknown")
-                observations = img_evidence.get("observations", [])
+                observations = img_evidence.get("observations") or ()
                 global_assessment = img_evidence.get("global_assessment", {})
                 
-                message_parts.append(f"\n  Photo: {img_name}")
-                message_parts.append(f"  Total Observations: {len(observations)}")
+                append(
+                    f"\n  Photo: {img_evidence.get('image_name', 'unknown')}\n"
+                    f"  Total Observations: {len(observations)}"
+                )
                 
                 # Include global assessment
                 if global_assessment:
-                    overall_severity = global_assessment.get("overall_severity", "unknown")
+                    append(f"  Overall Severity: {global_assessment.get('overall_severity', 'unknown')}")
                     damage_summary = global_assessment.get("damage_summary", "")
-                    message_parts.append(f"  Overall Severity: {overall_severity}")
                     if damage_summary:
-                        message_parts.append(f"  Summary: {damage_summary}")
+                        append(f"  Summary: {damage_summary}")
                 
                 # Include ALL observations (not just first 3)
                 if observations:
-                    message_parts.append("  Observations:")
-                    for obs in observations:
-                        label = obs.get("label", "unknown")
-                        severity = obs.get("severity", "unknown")
-                        location = obs.get("location_text", "unknown location")
-                        confidence = obs.get("confidence", 0)
-                        
-                        # Safely format confidence
-                        try:
-                            confidence = float(confidence) if confidence is not None else 0.0
-                        except (ValueError, TypeError):
-                            confidence = 0.0
-                            
-                        message_parts.append(f"    - {label} ({severity}, confidence: {confidence:.2f}) at {location}")
+                    append("  Observations:")
+                    message_parts.extend(
+                        f"    - {obs.get('label', 'unknown')} ({obs.get('severity', 'unknown')}, "
+                        f"confidence: {_safe_float(obs.get('confidence')):.2f}) "
+                        f"at {obs.get('location_text', 'unknown location')}"
+                        for obs in observations
+                    )
         
         # Include FULL expense data with all line items
         expense = evidence_data.get("expense", {})
-        if expense and expense.get("total", 0) > 0:
-            # Safely format expense total
-            expense_total = expense.get('total', 0)
-            try:
-                expense_total = float(expense_total) if expense_total is not None else 0.0
-            except (ValueError, TypeError):
-                expense_total = 0.0
-                
+        expense_total = _safe_float(expense.get("total")) if expense else 0.0
+        if expense_total > 0:
             message_parts.extend([
                 "",
                 "INVOICE DETAILS:",
@@ -303,49 +359,17 @@ When responding to other agents:
             line_items = expense.get('line_items', [])
             if line_items:
                 message_parts.append("  Line Items:")
-                for item in line_items:
-                    desc = item.get('description', 'Unknown')
-                    qty = item.get('quantity', 1) or 1
-                    unit_price = item.get('unit_price') or 0
-                    amount = item.get('amount') or 0
-                    category = item.get('category', 'other')
-                    
-                    # Ensure numeric values are not None
-                    try:
-                        unit_price = float(unit_price) if unit_price is not None else 0.0
-                        amount = float(amount) if amount is not None else 0.0
-                        qty = int(qty) if qty is not None else 1
-                    except (ValueError, TypeError):
-                        unit_price = 0.0
-                        amount = 0.0
-                        qty = 1
-                    
-                    message_parts.append(
-                        f"    - {desc} (Qty: {qty}, Unit: ${unit_price:.2f}, "
-                        f"Total: ${amount:.2f}, Category: {category})"
-                    )
-                
-                # Safely format total
-                total = expense.get('total', 0)
-                try:
-                    total = float(total) if total is not None else 0.0
-                except (ValueError, TypeError):
-                    total = 0.0
-                message_parts.append(f"  Grand Total: ${total:.2f}")
-        
-        message_parts.extend([
-            "",
-            "TASK:",
-            "Please analyze this claim and provide a coverage determination.",
-            "",
-            "Use policy_retriever to query the policy knowledge base for relevant clauses.",
-            "Consider both coverage grants and applicable exclusions.",
-            "Provide a detailed rationale with specific policy citations.",
-            "",
-            "Return a complete JSON object with your coverage decision."
-        ])
+                message_parts.extend(
+                    f"    - {item.get('description', 'Unknown')} "
+                    f"(Qty: {_safe_int(item.get('quantity'), 1)}, "
+                    f"Unit: ${_safe_float(item.get('unit_price')):.2f}, "
+                    f"Total: ${_safe_float(item.get('amount')):.2f}, "
+                    f"Category: {item.get('category', 'other')})"
+                    for item in line_items
+                )
+                message_parts.append(f"  Grand Total: ${expense_total:.2f}")
         
-        return "\n".join(message_parts)
+        return "\n".join(message_parts) + _TASK_FOOTER
     
     def _parse_response(self, response_text: str) -> Dict[str, Any]:
         """
@@ -362,7 +386,8 @@ When responding to other agents:
                 logger.warning("Empty response text, returning default decision")
                 return self._default_decision()
             
-            logger.debug(f"Policy Interpreter response preview: {response_text[:200]}...")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Policy Interpreter response preview: %s...", response_text[:200])
             
             # Method 1: Try ResponseFormatter first
             decision_data = ResponseFormatter.extract_json_from_response(response_text)
@@ -383,8 +408,8 @@ When responding to other agents:
             return self._default_decision()
             
         except Exception as e:
-            logger.error(f"Error parsing response: {str(e)}")
-            logger.error(f"Response preview (first 200 chars): {response_text[:200] if response_text else 'EMPTY'}")
+            logger.error("Error parsing response: %s", e)
+            logger.error("Response preview (first 200 chars): %s", response_text[:200] if response_text else 'EMPTY')
             return self._default_decision()
     
     def _manual_json_extraction(self, response_text: str) -> Optional[Dict[str, Any]]:
@@ -397,54 +422,31 @@ When responding to other agents:
         Returns:
             Parsed JSON dictionary or None if extraction fails
         """
-        try:
-            # Find JSON block (look for outermost braces)
-            start_idx = response_text.find('{')
-            if start_idx == -1:
-                logger.debug("No opening brace found in response")
-                return None
-            
-            # Find matching closing brace by counting braces
-            brace_count = 0
-            end_idx = -1
-            in_string = False
-            escape_next = False
-            
-            for i in range(start_idx, len(response_text)):
-                char = response_text[i]
-                
-                if escape_next:
-                    escape_next = False
-                    continue
-                
-                if char == '\\':
-                    escape_next = True
-                    continue
-                
-                if char == '"' and not escape_next:
-                    in_string = not in_string
-                    continue
-                
-                if not in_string:
-                    if char == '{':
-                        brace_count += 1
-                    elif char == '}':
-                        brace_count -= 1
-                        if brace_count == 0:
-                            end_idx = i
-                            break
-            
-            if end_idx != -1:
-                json_text = response_text[start_idx:end_idx + 1]
-                logger.debug(f"Manual extraction found JSON of length: {len(json_text)}")
-                return json.loads(json_text)
-            else:
-                logger.debug("No matching closing brace found")
-                return None
+        stripped = response_text.strip()
+        if orjson is not None and stripped.startswith('{') and stripped.endswith('}'):
+            # Common case: the whole response is the JSON object
+            try:
+                return orjson.loads(stripped)
+            except orjson.JSONDecodeError:
+                pass
         
-        except (json.JSONDecodeError, Exception) as e:
-            logger.debug(f"Manual JSON extraction failed: {str(e)}")
+        # Decode the first complete JSON object, trying each '{' in turn so
+        # brace-like fragments in surrounding prose are skipped
+        start_idx = response_text.find('{')
+        if start_idx == -1:
+            logger.debug("No opening brace found in response")
             return None
+        
+        while start_idx != -1:
+            try:
+                decision_data, end_idx = _JSON_DECODER.raw_decode(response_text, start_idx)
+                logger.debug("Manual extraction found JSON of length: %s", end_idx - start_idx)
+                return decision_data
+            except json.JSONDecodeError:
+                start_idx = response_text.find('{', start_idx + 1)
+        
+        logger.debug("Manual JSON extraction failed: no complete JSON object found")
+        return None
     
     def _validate_and_complete_decision(self, decision_data: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -457,42 +459,19 @@ When responding to other agents:
             Validated and completed decision dictionary
         """
         # Ensure required fields are present
-        if "coverage_position" not in decision_data:
-            decision_data["coverage_position"] = "Deny"
-        
-        if "rationale" not in decision_data:
-            decision_data["rationale"] = "Unable to determine coverage"
-        
-        if "citations" not in decision_data:
-            decision_data["citations"] = []
-        
-        if "sensitivity" not in decision_data:
-            decision_data["sensitivity"] = "Additional evidence needed"
+        for key, default in _DECISION_DEFAULTS:
+            if key not in decision_data:
+                decision_data[key] = default()
         
         # Ensure coverage_details structure exists
-        if "coverage_details" not in decision_data:
-            decision_data["coverage_details"] = {}
-        
         coverage_details = decision_data["coverage_details"]
-        if "covered_items" not in coverage_details:
-            coverage_details["covered_items"] = []
-        
-        if "excluded_items" not in coverage_details:
-            coverage_details["excluded_items"] = []
-        
-        if "limitations" not in coverage_details:
-            coverage_details["limitations"] = []
-        
-        if "deductible_applies" not in coverage_details:
-            coverage_details["deductible_applies"] = False
-        
-        if "estimated_covered_amount" not in coverage_details:
-            coverage_details["estimated_covered_amount"] = 0.0
+        for key, default in _COVERAGE_DETAIL_DEFAULTS:
+            if key not in coverage_details:
+                coverage_details[key] = default()
         
         # Validate coverage_position values
-        valid_positions = ["Pay", "Partial", "Deny"]
-        if decision_data["coverage_position"] not in valid_positions:
-            logger.warning(f"Invalid coverage position: {decision_data['coverage_position']}, defaulting to Deny")
+        if decision_data["coverage_position"] not in _VALID_POSITIONS:
+            logger.warning("Invalid coverage position: %s, defaulting to Deny", decision_data['coverage_position'])
             decision_data["coverage_position"] = "Deny"
         
         return decision_data
@@ -547,7 +526,7 @@ When responding to other agents:
             return response_text
             
         except Exception as e:
-            logger.error(f"Failed to respond to objection: {str(e)}")
+            logger.error("Failed to respond to objection: %s", e)
             return f"I acknowledge the objection but encountered an error: {str(e)}"
     
     async def revise_decision(
@@ -578,11 +557,12 @@ When responding to other agents:
             revised_decision = self._parse_response(response_text)
             
             logger.info(
-                f"Policy Interpreter revised decision: {revised_decision.get('coverage_position', 'unknown')}"
+                "Policy Interpreter revised decision: %s",
+                revised_decision.get('coverage_position', 'unknown')
             )
             
             return revised_decision
             
         except Exception as e:
-            logger.error(f"Failed to revise decision: {str(e)}")
+            logger.error("Failed to revise decision: %s", e)
             return self._default_decision()
@@ -28,6 +28,9 @@ class ComplianceReviewerAgent(BaseClaimsAgent):
     by the LLM's reasoning capabilities and the compliance_checker plugin.
     """
     
+    # No per-instance state beyond BaseClaimsAgent's slots
+    __slots__ = ()
+    
     def __init__(self):
         """
         Initialize Compliance Reviewer agent.
@@ -216,16 +219,18 @@ When responding to other agents:
                 f"({blocking_count} blocking)"
             )
             
-            # Use ResponseFormatter to ensure consistent JSON output
-            try:
-                formatted_response = ResponseFormatter.format_json_response(review_data)
-                logger.debug("Review data formatted with ResponseFormatter")
-                
-                # Log the formatted response for debugging
-                logger.debug(f"Formatted review response: {formatted_response[:500]}...")
-                
-            except Exception as e:
-                logger.warning(f"Failed to format response with ResponseFormatter: {str(e)}")
+            # The delimited JSON is only used for debug output, so skip
+            # serializing the review unless debug logging is on
+            if logger.isEnabledFor(logging.DEBUG):
+                try:
+                    formatted_response = ResponseFormatter.format_json_response(review_data)
+                    logger.debug("Review data formatted with ResponseFormatter")
+                    
+                    # Log the formatted response for debugging
+                    logger.debug("Formatted review response: %s...", formatted_response[:500])
+                    
+                except Exception as e:
+                    logger.warning("Failed to format response with ResponseFormatter: %s", e)
             
             return review_data
             
@@ -4,6 +4,7 @@ import json
 import logging
 from typing import Dict, Any, List, Optional
 
+from ..agents.base import set_agent_session
 from ..agents.curator import EvidenceCuratorAgent
 from ..agents.interpreter import PolicyInterpreterAgent
 from ..agents.reviewer import ComplianceReviewerAgent
@@ -79,6 +80,7 @@ class SupervisorOrchestrator:
         """
         try:
             logger.info(f"Starting collaboration for claim: {claim_data.case_id}")
+            set_agent_session(claim_data.case_id)
             
             # Initialize conversation history
             self.conversation = ConversationHistory(case_id=claim_data.case_id)
@@ -412,6 +414,7 @@ class SupervisorOrchestrator:
     ) -> Dict[str, Any]:
         """Resume collaboration after user supplies supplemental evidence or opts to continue without uploads."""
         logger.info("Resuming collaboration with supplemental inputs")
+        set_agent_session(claim_data.case_id)
 
         try:
             self.conversation = ConversationHistory.from_export(prev_state.get("conversation", {}))
@@ -10,6 +10,46 @@ from semantic_kernel.functions import kernel_function
 
 logger = logging.getLogger(__name__)
 
+# EXIF lives in the JPEG APP1 segment, whose 16-bit length field caps it at
+# 64KB, and camera JPEGs place it right after SOI. Parsing only the header
+# avoids scanning multi-MB photos just to read their metadata.
+EXIF_HEADER_BYTES = 65536
+
+
+def _jpeg_header_slice(image_bytes: bytes) -> bytes:
+    """
+    Return the leading bytes of a JPEG that hold its metadata segments.
+    
+    Walks the marker segments up to start-of-scan so an oversized or late
+    APP1 segment is still covered; falls back to the first 64KB when the
+    markers cannot be walked. Non-JPEG data is returned unchanged.
+    
+    Args:
+        image_bytes: Raw image bytes
+        
+    Returns:
+        Prefix of image_bytes sufficient for EXIF and dimension parsing
+    """
+    if not image_bytes.startswith(b"\xff\xd8"):
+        return image_bytes
+    
+    offset = 2
+    size = len(image_bytes)
+    while offset + 4 <= size:
+        if image_bytes[offset] != 0xFF:
+            return image_bytes[:EXIF_HEADER_BYTES]
+        marker = image_bytes[offset + 1]
+        if marker == 0xFF:
+            # Fill byte before a marker
+            offset += 1
+            continue
+        if marker == 0xDA:
+            # Start of scan: everything PIL needs to open the image precedes it
+            return image_bytes[:offset + 2 + image_bytes[offset + 2] * 256 + image_bytes[offset + 3]]
+        offset += 2 + image_bytes[offset + 2] * 256 + image_bytes[offset + 3]
+    
+    return image_bytes[:EXIF_HEADER_BYTES]
+
 
 class EXIFReaderPlugin:
     """
@@ -98,9 +138,16 @@ class EXIFReaderPlugin:
             from PIL import Image
             from PIL.ExifTags import TAGS
             
-            # Open image
+            # Open image, parsing only the JPEG header when possible
             if image_bytes:
-                image = Image.open(BytesIO(image_bytes))
+                header = _jpeg_header_slice(image_bytes)
+                try:
+                    image = Image.open(BytesIO(header))
+                except Exception:
+                    if len(header) == len(image_bytes):
+                        raise
+                    logger.debug("JPEG header slice could not be parsed, using full image")
+                    image = Image.open(BytesIO(image_bytes))
             else:
                 image = Image.open(image_path)
             
@@ -3,15 +3,42 @@
 import json
 import logging
 import time
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 
 from semantic_kernel.functions import kernel_function
 
 from ..utils.bedrock_client import BedrockClient
 from ..utils.errors import DocumentProcessingError, ErrorType, ErrorContext
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+# Damage types detected when the caller does not restrict them
+DEFAULT_DAMAGE_LABELS = [
+    "water_damage",
+    "fire_damage",
+    "mold",
+    "structural_damage",
+    "roof_damage",
+    "ceiling_damage",
+    "wall_damage",
+    "floor_damage",
+    "smoke_damage",
+    "impact_damage",
+    "broken_glass",
+    "dent",
+    "scratch",
+    "collision_damage"
+]
+
+# Output token budget per image in a multi-image request, and Nova Pro's cap
+BATCH_TOKENS_PER_IMAGE = 4096
+MAX_OUTPUT_TOKENS = 10000
+
 
 class ImageAnalyzerPlugin:
     """
@@ -71,22 +98,7 @@ class ImageAnalyzerPlugin:
             
             # Default damage labels if not provided
             if allowed_labels is None:
-                allowed_labels = [
-                    "water_damage",
-                    "fire_damage",
-                    "mold",
-                    "structural_damage",
-                    "roof_damage",
-                    "ceiling_damage",
-                    "wall_damage",
-                    "floor_damage",
-                    "smoke_damage",
-                    "impact_damage",
-                    "broken_glass",
-                    "dent",
-                    "scratch",
-                    "collision_damage"
-                ]
+                allowed_labels = DEFAULT_DAMAGE_LABELS
             
             logger.debug(f"Using {len(allowed_labels)} damage labels for analysis")
             
@@ -190,6 +202,102 @@ class ImageAnalyzerPlugin:
             )
             raise DocumentProcessingError(context)
     
+    async def analyze_images_batch(
+        self,
+        items: List[Tuple[str, bytes]],
+        allowed_labels: Optional[List[str]] = None,
+        include_bboxes: bool = True
+    ) -> List[Optional[Dict[str, Any]]]:
+        """
+        Analyze several damage images in one Nova Pro request.
+        
+        Each image is labeled with its 1-based position and the model returns one
+        analysis per position, so the system prompt and round trip are shared
+        across the batch.
+        
+        Args:
+            items: List of (image_name, image_bytes) tuples
+            allowed_labels: Optional list of damage types to detect
+            include_bboxes: Whether to request bounding box coordinates
+            
+        Returns:
+            Structured results in item order; None for images the response
+            did not cover, so callers can analyze those individually
+            
+        Raises:
+            DocumentProcessingError: If the request or response parsing fails
+        """
+        try:
+            start_time = time.time()
+            logger.info(f"Starting batched image analysis: {len(items)} images")
+            
+            prompt = self._build_batch_analysis_prompt(
+                len(items),
+                allowed_labels if allowed_labels is not None else DEFAULT_DAMAGE_LABELS,
+                include_bboxes
+            )
+            
+            content: List[Dict[str, Any]] = []
+            for position, (_, image_bytes) in enumerate(items, start=1):
+                content.append({"text": f"Image {position}:"})
+                content.append({
+                    "image": {
+                        "format": self._detect_image_format(image_bytes),
+                        "source": {"bytes": image_bytes}
+                    }
+                })
+            content.append({"text": prompt})
+            
+            response = await self.bedrock.invoke_nova_pro(
+                messages=[{"role": "user", "content": content}],
+                temperature=0.0,
+                max_tokens=min(BATCH_TOKENS_PER_IMAGE * len(items), MAX_OUTPUT_TOKENS)
+            )
+            api_time = time.time() - start_time
+            
+            response_text = response.get("text", "")
+            if not response_text:
+                raise ValueError("Empty response from Nova Pro")
+            
+            parsed = self._parse_analysis_response(response_text)
+            if isinstance(parsed, dict):
+                parsed = parsed.get("images", [])
+            if not isinstance(parsed, list):
+                raise ValueError("Batched analysis response is not a JSON array")
+            
+            results: List[Optional[Dict[str, Any]]] = [None] * len(items)
+            for entry in parsed:
+                if not isinstance(entry, dict):
+                    continue
+                try:
+                    position = int(entry.get("image_index", 0))
+                except (ValueError, TypeError):
+                    continue
+                if 1 <= position <= len(items) and results[position - 1] is None:
+                    results[position - 1] = self._structure_analysis_result(
+                        entry,
+                        items[position - 1][0]
+                    )
+            
+            covered = sum(result is not None for result in results)
+            logger.info(
+                f"Batched image analysis complete: {covered}/{len(items)} images covered "
+                f"in {time.time() - start_time:.3f}s (API: {api_time:.3f}s)"
+            )
+            return results
+            
+        except Exception as e:
+            logger.error(f"Failed to analyze image batch: {str(e)}")
+            
+            context = ErrorContext(
+                error_type=ErrorType.IMAGE_ANALYSIS_FAILED,
+                message=f"Failed to analyze image batch: {str(e)}",
+                recoverable=True,
+                fallback_action="Analyze images individually",
+                original_exception=e
+            )
+            raise DocumentProcessingError(context)
+    
     def _detect_image_format(self, image_bytes: bytes) -> str:
         """
         Detect image format from bytes.
@@ -286,6 +394,39 @@ Return ONLY the JSON object, no additional text."""
         
         return prompt
     
+    def _build_batch_analysis_prompt(
+        self,
+        image_count: int,
+        allowed_labels: List[str],
+        include_bboxes: bool
+    ) -> str:
+        """
+        Build the analysis prompt for a multi-image request.
+        
+        Args:
+            image_count: Number of labeled images in the request
+            allowed_labels: List of damage types to detect
+            include_bboxes: Whether to request bounding boxes
+            
+        Returns:
+            Formatted prompt string
+        """
+        single_prompt = self._build_analysis_prompt(allowed_labels, include_bboxes)
+        # Drop the single-object return instruction; the batch returns an array
+        instructions = single_prompt.rsplit("\n\n", 1)[0]
+        
+        return f"""You are given {image_count} images, each preceded by a label "Image N:".
+Analyze each image independently; never attribute damage seen in one image to another.
+
+For each image, follow these instructions:
+
+{instructions}
+
+Return a JSON array with exactly one object per image, in order. Each object must
+have the structure above plus an "image_index" field holding the image's number N.
+
+Return ONLY the JSON array, no additional text."""
+    
     def _parse_analysis_response(self, response_text: str) -> Dict[str, Any]:
         """
         Parse the JSON response from Nova Pro.
@@ -315,8 +456,10 @@ Return ONLY the JSON object, no additional text."""
         text = text.strip()
         
         try:
+            if orjson is not None:
+                return orjson.loads(text)
             return json.loads(text)
-        except json.JSONDecodeError as e:
+        except ValueError as e:
             logger.error(f"Failed to parse JSON response: {text[:200]}...")
             raise ValueError(f"Invalid JSON response from Nova Pro: {str(e)}")
     
@@ -1,11 +1,15 @@
 """AWS Bedrock client wrapper with retry logic and error handling."""
 
+import asyncio
 import json
-import time
 import logging
 import os
 import base64
-from typing import Dict, List, Optional, Any
+import random
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
+from typing import Callable, Dict, List, Optional, Any, TypeVar
 import numpy as np
 import boto3
 from botocore.config import Config
@@ -21,6 +25,93 @@ logger = logging.getLogger(__name__)
 
 _API_KEY_SECRET_CACHE: Dict[str, str] = {}
 
+# boto3 calls block, so they run on this bounded pool to keep the event loop
+# free and let concurrent agent turns overlap their network latency.
+BEDROCK_IO_WORKERS = 16
+_BEDROCK_EXECUTOR = ThreadPoolExecutor(max_workers=BEDROCK_IO_WORKERS, thread_name_prefix="bedrock-io")
+
+T = TypeVar("T")
+
+# boto3 clients keyed by (service, client config); each owns a urllib3 pool, so
+# sharing them lets every agent and plugin reuse warm TLS connections.
+_BOTO_CLIENTS: Dict[tuple, Any] = {}
+_BOTO_CLIENTS_LOCK = threading.Lock()
+
+
+def get_boto_client(service_name: str, region: str, timeout: int, bearer: bool) -> Any:
+    """
+    Return a process-wide boto3 client for a Bedrock service.
+    
+    Args:
+        service_name: boto3 service name (e.g. "bedrock-runtime")
+        region: AWS region
+        timeout: Connect/read timeout in seconds
+        bearer: Whether to use Bedrock API key (bearer token) auth
+        
+    Returns:
+        Shared boto3 client; clients are thread-safe once created
+    """
+    key = (service_name, region, timeout, bearer)
+    client = _BOTO_CLIENTS.get(key)
+    if client is not None:
+        return client
+    
+    config_kwargs: Dict[str, Any] = {
+        "region_name": region,
+        "connect_timeout": timeout,
+        "read_timeout": timeout,
+        "retries": {"max_attempts": 0},  # We handle retries manually
+        # Enough sockets for every worker on the Bedrock I/O pool, kept alive between turns
+        "max_pool_connections": BEDROCK_IO_WORKERS,
+        "tcp_keepalive": True,
+    }
+    
+    # When an API key is present, instruct botocore to use bearer-token auth.
+    # Recent versions of botocore automatically honour AWS_BEARER_TOKEN_BEDROCK,
+    # but we set signature_version explicitly for clarity/future compatibility.
+    if bearer:
+        config_kwargs["signature_version"] = "bearer"
+    
+    # Client creation on the default session is not thread-safe.
+    with _BOTO_CLIENTS_LOCK:
+        client = _BOTO_CLIENTS.get(key)
+        if client is None:
+            client = _BOTO_CLIENTS[key] = boto3.client(service_name, config=Config(**config_kwargs))
+    return client
+
+
+@lru_cache(maxsize=8)
+def get_default_bedrock_client(
+    region: str,
+    model_id: str,
+    embedding_model_id: str,
+    timeout: int,
+    max_retries: int,
+) -> "BedrockClient":
+    """
+    Return the process-wide BedrockClient for a given configuration.
+    
+    Agents and plugins that are not handed a client share this one, so they
+    also share its auth resolution and boto3 connection pools.
+    
+    Args:
+        region: AWS region for Bedrock service
+        model_id: Model ID for Nova Pro
+        embedding_model_id: Model ID for Titan embeddings
+        timeout: Request timeout in seconds
+        max_retries: Maximum number of retry attempts
+        
+    Returns:
+        Shared BedrockClient instance
+    """
+    return BedrockClient(
+        region=region,
+        model_id=model_id,
+        embedding_model_id=embedding_model_id,
+        timeout=timeout,
+        max_retries=max_retries,
+    )
+
 
 class BedrockClient:
     """
@@ -66,26 +157,11 @@ class BedrockClient:
         else:
             logger.info("BedrockClient configured to use AWS IAM credentials (SigV4)")
         
-        # Configure boto3 client with timeouts and retries
-        config_kwargs: Dict[str, Any] = {
-            "region_name": region,
-            "connect_timeout": timeout,
-            "read_timeout": timeout,
-            "retries": {"max_attempts": 0},  # We handle retries manually
-        }
-        
-        # When an API key is present, instruct botocore to use bearer-token auth.
-        # Recent versions of botocore automatically honour AWS_BEARER_TOKEN_BEDROCK,
-        # but we set signature_version explicitly for clarity/future compatibility.
-        if self._using_bearer_token:
-            config_kwargs["signature_version"] = "bearer"
-        
-        config = Config(**config_kwargs)
-        
-        self.runtime = boto3.client("bedrock-runtime", config=config)
+        # Shared boto3 clients with pooled, keep-alive connections
+        self.runtime = get_boto_client("bedrock-runtime", region, timeout, self._using_bearer_token)
         # Optional: Agents for Amazon Bedrock runtime (only used if configured)
         try:
-            self.agents_runtime = boto3.client("bedrock-agent-runtime", config=config)
+            self.agents_runtime = get_boto_client("bedrock-agent-runtime", region, timeout, self._using_bearer_token)
         except Exception:
             self.agents_runtime = None
         
@@ -253,7 +329,7 @@ class BedrockClient:
                     f"Invoking Nova Pro (attempt {attempt + 1}/{self.max_retries})"
                 )
                 
-                response = self.runtime.converse(**params)
+                response = await self._run_blocking(self.runtime.converse, **params)
                 
                 logger.info(
                     f"Nova Pro invocation successful: "
@@ -276,9 +352,9 @@ class BedrockClient:
                 if self._is_retryable_error(error_code):
                     if attempt < self.max_retries - 1:
                         # Exponential backoff: 1s, 2s, 4s, ...
-                        wait_time = 2 ** attempt
-                        logger.info(f"Retrying in {wait_time} seconds...")
-                        time.sleep(wait_time)
+                        wait_time = self._backoff_delay(attempt)
+                        logger.info(f"Retrying in {wait_time:.2f} seconds...")
+                        await asyncio.sleep(wait_time)
                         continue
                 
                 # Non-retryable error or max retries reached
@@ -339,14 +415,7 @@ class BedrockClient:
                     f"Generating embedding (attempt {attempt + 1}/{self.max_retries})"
                 )
                 
-                response = self.runtime.invoke_model(
-                    modelId=self.embedding_model_id,
-                    body=body,
-                    contentType="application/json",
-                    accept="application/json"
-                )
-                
-                result = json.loads(response["body"].read())
+                result = await self._run_blocking(self._invoke_embedding_model, body)
                 embedding = np.array(result["embedding"], dtype=np.float32)
                 
                 logger.debug(f"Generated embedding: dimension={len(embedding)}")
@@ -366,9 +435,9 @@ class BedrockClient:
                 if self._is_retryable_error(error_code):
                     if attempt < self.max_retries - 1:
                         # Exponential backoff: 1s, 2s, 4s, ...
-                        wait_time = 2 ** attempt
-                        logger.info(f"Retrying in {wait_time} seconds...")
-                        time.sleep(wait_time)
+                        wait_time = self._backoff_delay(attempt)
+                        logger.info(f"Retrying in {wait_time:.2f} seconds...")
+                        await asyncio.sleep(wait_time)
                         continue
                 
                 # Non-retryable error or max retries reached
@@ -428,24 +497,14 @@ class BedrockClient:
             )
 
         try:
-            response = self.agents_runtime.invoke_agent(
-                agentId=agent_id,
-                agentAliasId=agent_alias_id,
-                sessionId=session_id or "default",
-                inputText=input_text,
+            return await self._run_blocking(
+                self._invoke_managed_agent_sync,
+                agent_id,
+                agent_alias_id,
+                input_text,
+                session_id,
             )
 
-            # Read streaming completion
-            chunks: List[str] = []
-            for event in response.get("completion", []):
-                # Event has keys like {'chunk': {'bytes': b'...'}}
-                try:
-                    if "chunk" in event and "bytes" in event["chunk"]:
-                        chunks.append(event["chunk"]["bytes"].decode("utf-8"))
-                except Exception:
-                    continue
-            return "".join(chunks)
-
         except ClientError as e:
             raise BedrockAPIError.from_client_error(
                 error=e,
@@ -454,6 +513,58 @@ class BedrockClient:
                 fallback_action=None,
             )
     
+    @staticmethod
+    async def _run_blocking(fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """
+        Run a blocking boto3 call on the shared Bedrock I/O pool.
+        
+        Args:
+            fn: Blocking callable to run
+            *args: Positional arguments for fn
+            **kwargs: Keyword arguments for fn
+            
+        Returns:
+            Whatever fn returns; exceptions propagate to the awaiting caller
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(_BEDROCK_EXECUTOR, partial(fn, *args, **kwargs))
+    
+    def _invoke_embedding_model(self, body: str) -> Dict[str, Any]:
+        """Call the Titan embedding model and decode its JSON body (blocking)."""
+        response = self.runtime.invoke_model(
+            modelId=self.embedding_model_id,
+            body=body,
+            contentType="application/json",
+            accept="application/json"
+        )
+        return json.loads(response["body"].read())
+    
+    def _invoke_managed_agent_sync(
+        self,
+        agent_id: str,
+        agent_alias_id: str,
+        input_text: str,
+        session_id: Optional[str],
+    ) -> str:
+        """Invoke a managed agent and drain its completion stream (blocking)."""
+        response = self.agents_runtime.invoke_agent(
+            agentId=agent_id,
+            agentAliasId=agent_alias_id,
+            sessionId=session_id or "default",
+            inputText=input_text,
+        )
+
+        # Read streaming completion
+        chunks: List[str] = []
+        for event in response.get("completion", []):
+            # Event has keys like {'chunk': {'bytes': b'...'}}
+            try:
+                if "chunk" in event and "bytes" in event["chunk"]:
+                    chunks.append(event["chunk"]["bytes"].decode("utf-8"))
+            except Exception:
+                continue
+        return "".join(chunks)
+    
     def _parse_converse_response(self, response: Dict[str, Any]) -> Dict[str, Any]:
         """
         Parse Converse API response into a simplified format.
@@ -487,6 +598,23 @@ class BedrockClient:
         
         return parsed
     
+    @staticmethod
+    def _backoff_delay(attempt: int) -> float:
+        """
+        Return the wait before a retry: exponential backoff with random jitter.
+        
+        Callers fan out many plugin calls at once, so a throttling burst fails
+        them together; jitter keeps their retries from landing in lockstep.
+        
+        Args:
+            attempt: Zero-based attempt that just failed
+            
+        Returns:
+            Seconds to wait
+        """
+        base = 2 ** attempt
+        return base + random.uniform(0, base / 2)
+    
     def _is_retryable_error(self, error_code: str) -> bool:
         """
         Determine if an error code is retryable.
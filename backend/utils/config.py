@@ -2,7 +2,8 @@
 
 import os
 import yaml
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from functools import lru_cache
 
 
 @dataclass
@@ -12,6 +13,9 @@ class BedrockConfig:
     embedding_model_id: str
     timeout: int
     max_retries: int
+    prompt_caching: bool = False
+    max_concurrency: int = 4
+    max_history_messages: int = 20
 
 
 @dataclass
@@ -26,6 +30,16 @@ class BedrockAgentsConfig:
     reviewer_alias_id: str = ""
 
 
+@dataclass
+class SemanticCacheConfig:
+    """Semantic response cache configuration for agent prompts."""
+    enabled: bool = False
+    threshold: float = 0.97
+    ttl_seconds: int = 3600
+    max_entries: int = 256
+    max_namespaces: int = 64
+
+
 @dataclass
 class VectorStoreConfig:
     """FAISS vector store configuration."""
@@ -72,12 +86,17 @@ class Config:
     storage: StorageConfig
     logging: LoggingConfig
     bedrock_agents: BedrockAgentsConfig
+    semantic_cache: SemanticCacheConfig = field(default_factory=SemanticCacheConfig)
     
     @classmethod
+    @lru_cache(maxsize=4)
     def load(cls, config_path: str = "config.yaml") -> "Config":
         """
         Load configuration from file and environment variables.
         
+        The result is cached per path, so every caller shares one instance;
+        treat it as read-only.
+        
         Environment variables override config file values:
         - AWS_REGION
         - BEDROCK_MODEL_ID
@@ -101,7 +120,10 @@ class Config:
             model_id=os.getenv("BEDROCK_MODEL_ID", config_data["aws"]["bedrock"]["model_id"]),
             embedding_model_id=config_data["aws"]["bedrock"]["embedding_model_id"],
             timeout=config_data["aws"]["bedrock"]["timeout"],
-            max_retries=config_data["aws"]["bedrock"]["max_retries"]
+            max_retries=config_data["aws"]["bedrock"]["max_retries"],
+            prompt_caching=bool(config_data["aws"]["bedrock"].get("prompt_caching", False)),
+            max_concurrency=int(config_data["aws"]["bedrock"].get("max_concurrency", 4)),
+            max_history_messages=int(config_data["aws"]["bedrock"].get("max_history_messages", 20))
         )
         
         # Vector store configuration
@@ -157,6 +179,16 @@ class Config:
             reviewer_alias_id=(ba.get("reviewer", {}) or {}).get("agent_alias_id", ""),
         )
 
+        # Semantic response cache configuration (optional)
+        sc = config_data.get("semantic_cache", {}) or {}
+        semantic_cache_config = SemanticCacheConfig(
+            enabled=bool(sc.get("enabled", False)),
+            threshold=float(sc.get("threshold", 0.97)),
+            ttl_seconds=int(sc.get("ttl_seconds", 3600)),
+            max_entries=int(sc.get("max_entries", 256)),
+            max_namespaces=int(sc.get("max_namespaces", 64)),
+        )
+
         return cls(
             aws_region=aws_region,
             bedrock=bedrock_config,
@@ -168,4 +200,5 @@ class Config:
             storage=storage_config,
             logging=logging_config,
             bedrock_agents=bedrock_agents_config,
+            semantic_cache=semantic_cache_config,
         )
@@ -0,0 +1,92 @@
+"""In-process cache of plugin results keyed by file content."""
+
+import copy
+import hashlib
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class ContentCache:
+    """
+    LRU cache of plugin outputs keyed by a digest of the input bytes.
+
+    Re-running a claim (a retry, or a reviewer reopening a case) re-uploads
+    byte-identical files, and a photo attached twice is analyzed twice. Keying
+    results by content lets those repeats skip the Bedrock call entirely.
+    Entries are namespaced by kind (e.g. "photo", "invoice") so the same bytes
+    can carry a different result per plugin.
+
+    Values are deep-copied on the way in and out, since callers mutate the
+    dictionaries they get back. The cache is shared across reasoner threads,
+    so all access is locked.
+    """
+
+    def __init__(self, max_entries: int = 512, ttl_seconds: int = 3600):
+        """
+        Initialize ContentCache.
+
+        Args:
+            max_entries: Maximum cached results across all kinds
+            ttl_seconds: Lifetime of a cached result
+        """
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+
+        self._lock = threading.Lock()
+        # (kind, digest) -> (value, expires_at), least recently used first
+        self._entries: "OrderedDict[Tuple[str, str], Tuple[Any, float]]" = OrderedDict()
+
+    @staticmethod
+    def digest(data: bytes) -> str:
+        """Return the content digest used as a cache key."""
+        return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+    def get(self, kind: str, digest: str) -> Optional[Any]:
+        """
+        Return a copy of the cached result for some content, if present.
+
+        Args:
+            kind: Plugin result kind
+            digest: Content digest from digest()
+
+        Returns:
+            Cached result, or None on a miss
+        """
+        key = (kind, digest)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry[1] < time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            value = entry[0]
+        logger.debug("Content cache hit: kind=%s digest=%s", kind, digest)
+        return copy.deepcopy(value)
+
+    def put(self, kind: str, digest: str, value: Any) -> None:
+        """
+        Cache a result for some content.
+
+        Args:
+            kind: Plugin result kind
+            digest: Content digest from digest()
+            value: Result to reuse on later hits
+        """
+        entry = (copy.deepcopy(value), time.monotonic() + self.ttl_seconds)
+        with self._lock:
+            self._entries[(kind, digest)] = entry
+            self._entries.move_to_end((kind, digest))
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop every cached result."""
+        with self._lock:
+            self._entries.clear()
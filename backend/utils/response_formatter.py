@@ -5,6 +5,11 @@ import logging
 import re
 from typing import Dict, Any, Optional, Union
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
 
@@ -42,7 +47,7 @@ class ResponseFormatter:
                 json.loads(data)
                 json_str = data
             else:
-                json_str = json.dumps(data, indent=2, ensure_ascii=False)
+                json_str = ResponseFormatter._dumps_pretty(data)
             
             formatted = (
                 f"{ResponseFormatter.JSON_START_DELIMITER}\n"
@@ -57,6 +62,30 @@ class ResponseFormatter:
             logger.error(f"Failed to format JSON response: {str(e)}")
             raise ValueError(f"Cannot format data as JSON: {str(e)}") from e
     
+    @staticmethod
+    def _dumps_pretty(data: Any) -> str:
+        """
+        Serialize data as 2-space indented JSON, using orjson when available.
+        
+        Falls back to the stdlib encoder for values orjson rejects (e.g. integers
+        beyond 64 bits), so both paths accept the same inputs.
+        
+        Args:
+            data: JSON-serializable value
+            
+        Returns:
+            Indented JSON string
+        """
+        if orjson is not None:
+            try:
+                return orjson.dumps(
+                    data,
+                    option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+                ).decode("utf-8")
+            except orjson.JSONEncodeError:
+                pass
+        return json.dumps(data, indent=2, ensure_ascii=False)
+    
     @staticmethod
     def extract_json_from_response(response_text: str) -> Optional[Dict[str, Any]]:
         """
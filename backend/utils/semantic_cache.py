@@ -0,0 +1,198 @@
+"""In-process semantic response cache for agent prompts."""
+
+import hashlib
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import faiss
+
+logger = logging.getLogger(__name__)
+
+# (index, vectors, [(response, expires_at, text_digest), ...], {text_digest: entry})
+_Space = Tuple[
+    faiss.Index,
+    List[np.ndarray],
+    List[Tuple[str, float, str]],
+    Dict[str, Tuple[str, float, str]],
+]
+
+
+class SemanticCache:
+    """
+    Cache of model responses looked up by embedding similarity.
+
+    Entries are partitioned by namespace (e.g. a digest of the system prompt
+    and conversation history), so only prompts sharing the same prefix are
+    ever compared. Within a namespace, a FAISS inner-product index over
+    L2-normalized embeddings finds the nearest earlier prompt; a hit requires
+    cosine similarity at or above the threshold and an unexpired entry.
+    Prompts repeated verbatim are also indexed by digest, so callers can
+    check lookup_exact first and skip computing an embedding at all.
+
+    Namespaces are kept least recently used first. Since conversation history
+    is part of the namespace, most turns open a new one; once max_namespaces
+    is reached, expired namespaces and then the least recently used ones are
+    dropped, so the cache holds at most max_namespaces * max_entries entries.
+
+    The cache is shared across reasoner threads, so all access is locked.
+    """
+
+    def __init__(
+        self,
+        dimension: int = 1024,
+        threshold: float = 0.97,
+        ttl_seconds: int = 3600,
+        max_entries: int = 256,
+        max_namespaces: int = 64
+    ):
+        """
+        Initialize SemanticCache.
+
+        Args:
+            dimension: Embedding vector dimension (1024 for Titan)
+            threshold: Minimum cosine similarity for a hit
+            ttl_seconds: Lifetime of a cached response
+            max_entries: Maximum entries kept per namespace
+            max_namespaces: Maximum namespaces kept at once
+        """
+        self.dimension = dimension
+        self.threshold = threshold
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.max_namespaces = max(1, max_namespaces)
+
+        self._lock = threading.Lock()
+        # namespace -> space, least recently used first
+        self._spaces: "OrderedDict[str, _Space]" = OrderedDict()
+
+    def lookup_exact(self, namespace: str, text: str) -> Optional[str]:
+        """
+        Return the cached response for a prompt seen verbatim before.
+
+        Args:
+            namespace: Partition the prompt belongs to
+            text: Prompt text
+
+        Returns:
+            Cached response text, or None on a miss
+        """
+        digest = self._digest(text)
+        with self._lock:
+            space = self._spaces.get(namespace)
+            if space is None:
+                return None
+            entry = space[3].get(digest)
+            if entry is None or entry[1] < time.monotonic():
+                return None
+            self._spaces.move_to_end(namespace)
+            logger.debug("Semantic cache exact hit")
+            return entry[0]
+
+    def lookup(self, namespace: str, embedding: np.ndarray) -> Optional[str]:
+        """
+        Return the cached response closest to an embedding, if similar enough.
+
+        Args:
+            namespace: Partition the prompt belongs to
+            embedding: Embedding of the prompt
+
+        Returns:
+            Cached response text, or None on a miss
+        """
+        query = self._normalize(embedding)
+        with self._lock:
+            space = self._spaces.get(namespace)
+            if space is None:
+                return None
+            index, _, entries, _ = space
+            scores, ids = index.search(query, 1)
+            score, idx = float(scores[0][0]), int(ids[0][0])
+            if idx < 0 or score < self.threshold:
+                return None
+            response, expires_at, _ = entries[idx]
+            if expires_at < time.monotonic():
+                return None
+            self._spaces.move_to_end(namespace)
+            logger.debug(f"Semantic cache hit: similarity={score:.4f}")
+            return response
+
+    def store(self, namespace: str, embedding: np.ndarray, response: str, text: str) -> None:
+        """
+        Add a response to the cache.
+
+        Args:
+            namespace: Partition the prompt belongs to
+            embedding: Embedding of the prompt
+            response: Model response to reuse on later hits
+            text: Prompt text, indexed for exact-match lookups
+        """
+        vector = self._normalize(embedding)
+        digest = self._digest(text)
+        now = time.monotonic()
+        with self._lock:
+            space = self._spaces.get(namespace)
+            if space is None:
+                self._evict_namespaces(now)
+                space = self._spaces[namespace] = (faiss.IndexFlatIP(self.dimension), [], [], {})
+            else:
+                self._spaces.move_to_end(namespace)
+            index, vectors, entries, exact = space
+
+            if len(entries) >= self.max_entries:
+                # Drop expired entries, then the oldest, and rebuild the flat index.
+                keep = [i for i, entry in enumerate(entries) if entry[1] >= now]
+                keep = keep[-(self.max_entries - 1):] if self.max_entries > 1 else []
+                vectors[:] = [vectors[i] for i in keep]
+                entries[:] = [entries[i] for i in keep]
+                exact.clear()
+                exact.update((entry[2], entry) for entry in entries)
+                index.reset()
+                if vectors:
+                    index.add(np.vstack(vectors))
+
+            entry = (response, now + self.ttl_seconds, digest)
+            index.add(vector)
+            vectors.append(vector)
+            entries.append(entry)
+            exact[digest] = entry
+
+    def clear(self) -> None:
+        """Drop every cached response."""
+        with self._lock:
+            self._spaces.clear()
+
+    def __len__(self) -> int:
+        """Return the number of cached responses across all namespaces."""
+        with self._lock:
+            return sum(len(space[2]) for space in self._spaces.values())
+
+    def _evict_namespaces(self, now: float) -> None:
+        """
+        Make room for one more namespace; the caller holds the lock.
+
+        Args:
+            now: Current monotonic time
+        """
+        if len(self._spaces) < self.max_namespaces:
+            return
+        # Entries are appended in time order, so a space is fully expired
+        # once its newest entry is.
+        for key in [key for key, space in self._spaces.items() if not space[2] or space[2][-1][1] < now]:
+            del self._spaces[key]
+        while len(self._spaces) >= self.max_namespaces:
+            self._spaces.popitem(last=False)
+
+    @staticmethod
+    def _digest(text: str) -> str:
+        """Return a digest identifying a prompt verbatim."""
+        return hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+
+    def _normalize(self, embedding: np.ndarray) -> np.ndarray:
+        """Return a (1, dimension) float32 copy with unit L2 norm."""
+        vector = np.array(embedding, dtype=np.float32).reshape(1, -1)
+        faiss.normalize_L2(vector)
+        return vector
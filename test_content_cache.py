@@ -0,0 +1,67 @@
+"""Tests for the content-addressed plugin result cache."""
+
+from backend.utils import content_cache
+from backend.utils.content_cache import ContentCache
+
+
+def test_entries_expire_after_ttl(monkeypatch):
+    """A result is served until its TTL passes, then dropped."""
+    now = [1000.0]
+    monkeypatch.setattr(content_cache.time, "monotonic", lambda: now[0])
+    cache = ContentCache(ttl_seconds=60)
+    digest = cache.digest(b"photo bytes")
+    cache.put("photo", digest, {"label": "dent"})
+
+    now[0] += 59
+    assert cache.get("photo", digest) == {"label": "dent"}
+
+    now[0] += 2
+    assert cache.get("photo", digest) is None
+    assert len(cache._entries) == 0
+
+
+def test_least_recently_used_entry_is_evicted_at_max_entries():
+    """Past max_entries, the entry used longest ago is dropped first."""
+    cache = ContentCache(max_entries=3)
+    digests = [cache.digest(f"file-{i}".encode()) for i in range(4)]
+    for i, digest in enumerate(digests[:3]):
+        cache.put("invoice", digest, {"total": i})
+
+    assert cache.get("invoice", digests[0]) == {"total": 0}
+    cache.put("invoice", digests[3], {"total": 3})
+
+    assert len(cache._entries) == 3
+    assert cache.get("invoice", digests[1]) is None
+    assert cache.get("invoice", digests[0]) == {"total": 0}
+    assert cache.get("invoice", digests[3]) == {"total": 3}
+
+
+def test_kinds_with_the_same_digest_do_not_collide():
+    """The same bytes cached under different kinds keep separate results."""
+    cache = ContentCache()
+    digest = cache.digest(b"same upload")
+    cache.put("photo", digest, {"kind": "photo"})
+    cache.put("fnol_form", digest, {"kind": "fnol_form"})
+
+    assert cache.get("photo", digest) == {"kind": "photo"}
+    assert cache.get("fnol_form", digest) == {"kind": "fnol_form"}
+    assert cache.get("invoice", digest) is None
+
+
+def test_cached_values_are_isolated_from_callers():
+    """Mutating a stored or returned value does not change the cache."""
+    cache = ContentCache()
+    digest = cache.digest(b"photo bytes")
+    value = {"observations": ["dent"]}
+    cache.put("photo", digest, value)
+
+    value["observations"].append("scratch")
+    cache.get("photo", digest)["observations"].append("crack")
+
+    assert cache.get("photo", digest) == {"observations": ["dent"]}
+
+
+def test_digest_depends_only_on_content():
+    """Identical bytes share a digest; different bytes do not."""
+    assert ContentCache.digest(b"abc") == ContentCache.digest(b"abc")
+    assert ContentCache.digest(b"abc") != ContentCache.digest(b"abd")
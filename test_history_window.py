@@ -0,0 +1,93 @@
+"""Tests for the conversation history window agents forward to Bedrock."""
+
+import copy
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from backend.agents.base import BaseClaimsAgent
+
+
+class _EchoAgent(BaseClaimsAgent):
+    """Minimal concrete agent for exercising BaseClaimsAgent helpers."""
+
+    __slots__ = ()
+
+    async def invoke(self, context):
+        return context
+
+
+def _agent(max_history_messages: int) -> _EchoAgent:
+    """Return an agent with a mocked Bedrock client and the given cap."""
+    bedrock = MagicMock()
+    bedrock.model_id = "amazon.nova-pro-v1:0"
+    bedrock.invoke_nova_pro = AsyncMock(return_value={"content": [{"text": "ok"}]})
+    agent = _EchoAgent(name="test-agent", instructions="Be brief.", bedrock=bedrock)
+    agent._max_history_messages = max_history_messages
+    agent._semantic_cache = None
+    return agent
+
+
+def _history(roles: str) -> list:
+    """Build a history from a role string such as "uaua" (user/assistant)."""
+    names = {"u": "user", "a": "assistant"}
+    return [{"role": names[r], "content": [{"text": f"{names[r]}-{i}"}]} for i, r in enumerate(roles)]
+
+
+def test_history_within_cap_is_forwarded_as_is():
+    """A history at or under the cap is returned unchanged."""
+    history = _history("uaua")
+    assert _agent(4)._recent_history(history) is history
+    assert _agent(4)._recent_history(None) == []
+
+
+def test_window_starting_on_assistant_skips_to_user():
+    """A window that would open on an assistant reply starts at the next user turn."""
+    history = _history("uauaua")
+    window = _agent(3)._recent_history(history)
+
+    assert [m["content"][0]["text"] for m in window] == ["user-4", "assistant-5"]
+    assert window[0]["role"] == "user"
+
+
+def test_window_keeps_consecutive_turns_after_first_user():
+    """Only the leading assistant turns are dropped, not later ones."""
+    history = _history("uuaauaau")
+    window = _agent(5)._recent_history(history)
+
+    assert [m["role"] for m in window] == ["user", "assistant", "assistant", "user"]
+
+
+def test_all_assistant_tail_yields_empty_history():
+    """A window with no user turn is dropped entirely rather than sent invalid."""
+    history = _history("uaaaa")
+    assert _agent(3)._recent_history(history) == []
+
+
+def test_zero_disables_the_cap():
+    """max_history_messages = 0 forwards the full history."""
+    history = _history("ua" * 30)
+    assert _agent(0)._recent_history(history) is history
+
+
+def test_callers_history_is_not_modified():
+    """Trimming returns a new list and leaves the caller's messages untouched."""
+    history = _history("uauaua")
+    snapshot = copy.deepcopy(history)
+    _agent(2)._recent_history(history)
+
+    assert history == snapshot
+
+
+@pytest.mark.asyncio
+async def test_get_response_sends_trimmed_history():
+    """get_response forwards only the window plus the new user turn."""
+    agent = _agent(2)
+    history = _history("uauaua")
+    snapshot = copy.deepcopy(history)
+
+    assert await agent.get_response(history, "next question") == "ok"
+
+    messages = agent.bedrock.invoke_nova_pro.await_args.kwargs["messages"]
+    assert [m["content"][0]["text"] for m in messages] == ["user-4", "assistant-5", "next question"]
+    assert history == snapshot
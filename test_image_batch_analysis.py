@@ -0,0 +1,149 @@
+"""Tests for batched damage photo analysis and the curator's per-image fallback."""
+
+import json
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from backend.agents.curator import EvidenceCuratorAgent, _RESULT_CACHE
+from backend.plugins.image_analyzer import ImageAnalyzerPlugin
+from backend.utils.errors import DocumentProcessingError
+
+
+# Fake JPEGs: format detection only looks at the magic bytes
+PHOTOS = [(f"photo_{i}.jpg", b"\xff\xd8\xff" + f"image-{i}".encode()) for i in range(1, 4)]
+
+
+def _analysis(label: str, **extra) -> dict:
+    """Return a minimal per-image analysis as the model would emit it."""
+    return {
+        "observations": [{"label": label, "confidence": 0.9, "severity": "minor", "novelty": "new"}],
+        "global_assessment": {"overall_condition": label},
+        "chronology": {},
+        **extra,
+    }
+
+
+def _labels(results) -> list:
+    """Return the first observation label of each result, or None."""
+    return [result["observations"][0]["label"] if result else None for result in results]
+
+
+def _fake_bedrock(batch_response=None, batch_error=None) -> MagicMock:
+    """
+    Return a Bedrock client mock serving batch and single-image requests.
+
+    Single-image requests are answered with a label derived from the image
+    bytes, so tests can tell which image each result belongs to.
+    """
+
+    async def invoke_nova_pro(messages, **kwargs):
+        content = messages[0]["content"]
+        images = [block["image"]["source"]["bytes"] for block in content if "image" in block]
+        if any(block.get("text", "").startswith("Image 1:") for block in content):
+            if batch_error is not None:
+                raise batch_error
+            text = batch_response if isinstance(batch_response, str) else json.dumps(batch_response)
+            return {"text": text}
+        return {"text": json.dumps(_analysis(f"single-{images[0][3:].decode()}"))}
+
+    bedrock = MagicMock()
+    bedrock.model_id = "amazon.nova-pro-v1:0"
+    bedrock.invoke_nova_pro = AsyncMock(side_effect=invoke_nova_pro)
+    return bedrock
+
+
+@pytest.fixture(autouse=True)
+def clear_result_cache():
+    """Keep cached photo analyses from leaking between tests."""
+    _RESULT_CACHE.clear()
+    yield
+    _RESULT_CACHE.clear()
+
+
+@pytest.mark.asyncio
+async def test_batch_accepts_json_list():
+    """A bare JSON array maps each entry to its image_index."""
+    bedrock = _fake_bedrock([_analysis(f"batch-{i}", image_index=i) for i in (1, 2, 3)])
+    results = await ImageAnalyzerPlugin(bedrock).analyze_images_batch(PHOTOS)
+
+    assert _labels(results) == ["batch-1", "batch-2", "batch-3"]
+    assert [result["image_name"] for result in results] == [name for name, _ in PHOTOS]
+    bedrock.invoke_nova_pro.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_batch_accepts_images_key():
+    """A JSON object wrapping the list under "images" is unwrapped."""
+    bedrock = _fake_bedrock({"images": [_analysis(f"batch-{i}", image_index=i) for i in (1, 2, 3)]})
+    results = await ImageAnalyzerPlugin(bedrock).analyze_images_batch(PHOTOS)
+
+    assert _labels(results) == ["batch-1", "batch-2", "batch-3"]
+
+
+@pytest.mark.asyncio
+async def test_batch_maps_reordered_repeated_and_missing_indices():
+    """Entries follow image_index, not response order; gaps stay None."""
+    bedrock = _fake_bedrock([
+        _analysis("third", image_index=3),
+        _analysis("first", image_index="1"),
+        _analysis("first-again", image_index=1),
+        _analysis("out-of-range", image_index=7),
+        _analysis("no-index"),
+        "not an object",
+    ])
+    results = await ImageAnalyzerPlugin(bedrock).analyze_images_batch(PHOTOS)
+
+    assert _labels(results) == ["first", None, "third"]
+    assert results[2]["image_name"] == "photo_3.jpg"
+
+
+@pytest.mark.asyncio
+async def test_batch_object_without_images_covers_nothing():
+    """A JSON object without an "images" list leaves every image to the fallback."""
+    bedrock = _fake_bedrock({"unexpected": True})
+    results = await ImageAnalyzerPlugin(bedrock).analyze_images_batch(PHOTOS)
+
+    assert results == [None, None, None]
+
+
+@pytest.mark.asyncio
+async def test_batch_rejects_unparseable_response():
+    """A response that is not JSON raises a recoverable error."""
+    bedrock = _fake_bedrock("I could not analyze these images.")
+    with pytest.raises(DocumentProcessingError):
+        await ImageAnalyzerPlugin(bedrock).analyze_images_batch(PHOTOS)
+
+
+def _curator(bedrock: MagicMock) -> EvidenceCuratorAgent:
+    """Return a curator whose plugins talk to the given Bedrock mock."""
+    curator = EvidenceCuratorAgent()
+    curator._plugin_bedrock_client = bedrock
+    curator._nova_vision = ImageAnalyzerPlugin(bedrock)
+    curator._exif_reader = MagicMock()
+    curator._exif_reader.extract_metadata.return_value = {"has_exif": False}
+    return curator
+
+
+@pytest.mark.asyncio
+async def test_curator_analyzes_uncovered_photos_individually():
+    """A photo the batch response skips falls back to its own request."""
+    bedrock = _fake_bedrock([_analysis("batch-1", image_index=1), _analysis("batch-3", image_index=3)])
+    outcomes = await _curator(bedrock)._process_photo_batch(PHOTOS)
+
+    evidence = [outcome["image_evidence"] for outcome in outcomes]
+    assert [entry["image_name"] for entry in evidence] == [name for name, _ in PHOTOS]
+    assert _labels(evidence) == ["batch-1", "single-image-2", "batch-3"]
+    assert bedrock.invoke_nova_pro.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_curator_falls_back_when_batch_fails():
+    """A failed batch request re-analyzes every photo individually."""
+    bedrock = _fake_bedrock(batch_error=RuntimeError("throttled"))
+    outcomes = await _curator(bedrock)._process_photo_batch(PHOTOS)
+
+    assert _labels([outcome["image_evidence"] for outcome in outcomes]) == [
+        "single-image-1", "single-image-2", "single-image-3"
+    ]
+    assert bedrock.invoke_nova_pro.await_count == 4
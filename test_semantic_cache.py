@@ -0,0 +1,70 @@
+"""Tests for the semantic response cache."""
+
+import numpy as np
+
+from backend.utils.semantic_cache import SemanticCache
+
+
+def _vector(seed: int, dimension: int = 8) -> np.ndarray:
+    """Return a deterministic random embedding."""
+    return np.random.default_rng(seed).random(dimension, dtype=np.float32)
+
+
+def test_exact_and_similar_lookups():
+    """A stored prompt is found verbatim and by a near-identical embedding."""
+    cache = SemanticCache(dimension=8, threshold=0.99)
+    cache.store("ns", _vector(1), "answer", "prompt")
+
+    assert cache.lookup_exact("ns", "prompt") == "answer"
+    assert cache.lookup("ns", _vector(1) * 2) == "answer"
+    assert cache.lookup_exact("other", "prompt") is None
+    assert cache.lookup("ns", _vector(2)) is None
+
+
+def test_namespaces_stay_bounded():
+    """Filling many one-entry namespaces never grows past max_namespaces."""
+    cache = SemanticCache(dimension=8, max_entries=4, max_namespaces=5)
+
+    for i in range(200):
+        cache.store(f"history-{i}", _vector(i), f"answer-{i}", f"prompt-{i}")
+        assert len(cache._spaces) <= 5
+
+    assert len(cache) == 5
+    assert cache.lookup_exact("history-199", "prompt-199") == "answer-199"
+    assert cache.lookup_exact("history-0", "prompt-0") is None
+
+
+def test_entries_stay_bounded_across_namespaces():
+    """Total entries are capped at max_namespaces * max_entries."""
+    cache = SemanticCache(dimension=8, max_entries=3, max_namespaces=4)
+
+    for i in range(100):
+        cache.store(f"history-{i % 10}", _vector(i), f"answer-{i}", f"prompt-{i}")
+
+    assert len(cache) <= 3 * 4
+
+
+def test_recently_used_namespace_survives_eviction():
+    """A namespace hit since it was stored is evicted after older ones."""
+    cache = SemanticCache(dimension=8, max_namespaces=3)
+    for i in range(3):
+        cache.store(f"history-{i}", _vector(i), f"answer-{i}", f"prompt-{i}")
+
+    assert cache.lookup_exact("history-0", "prompt-0") == "answer-0"
+    cache.store("history-3", _vector(3), "answer-3", "prompt-3")
+
+    assert cache.lookup_exact("history-0", "prompt-0") == "answer-0"
+    assert cache.lookup_exact("history-1", "prompt-1") is None
+
+
+def test_expired_namespaces_are_dropped_first():
+    """Expired namespaces make room before any live one is evicted."""
+    cache = SemanticCache(dimension=8, ttl_seconds=-1, max_namespaces=3)
+    for i in range(3):
+        cache.store(f"stale-{i}", _vector(i), f"answer-{i}", f"prompt-{i}")
+
+    cache.ttl_seconds = 3600
+    cache.store("live", _vector(10), "answer", "prompt")
+
+    assert len(cache._spaces) == 1
+    assert cache.lookup_exact("live", "prompt") == "answer"